@@ -71,6 +71,14 @@ class JiraClient:
             if len(json_str) > 1000:
                 json_str = f"{json_str[:1000]}... (truncated)"
             self.logger.debug(f"JSON: {json_str}")
+            
+        if "data" in kwargs and kwargs["data"]:
+            data_str = kwargs["data"]
+            if isinstance(data_str, bytes):
+                data_str = data_str.decode('utf-8', errors='replace')
+            if len(data_str) > 1000:
+                data_str = f"{data_str[:1000]}... (truncated)"
+            self.logger.debug(f"Body: {data_str}")
     
     def _log_response(self, response: requests.Response):
         """Log response details if debug mode is enabled."""
@@ -113,7 +121,8 @@ class JiraClient:
             raise
     
     def post(self, endpoint: str, json_data: Optional[Dict[str, Any]] = None,
-            params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+            params: Optional[Dict[str, Any]] = None,
+            data: Optional[Union[str, bytes]] = None) -> Dict[str, Any]:
         """
         Make a POST request to the Jira API.
         
@@ -121,14 +130,15 @@ class JiraClient:
             endpoint: API endpoint relative to the base URL
             json_data: Optional JSON data to send
             params: Optional query parameters
+            data: Optional pre-encoded JSON body, sent as-is instead of json_data
             
         Returns:
             Response data as dictionary
         """
         url = urljoin(self.base_url, endpoint)
-        self._log_request("POST", url, json=json_data, params=params)
+        self._log_request("POST", url, json=json_data, data=data, params=params)
         
-        response = self.session.post(url, json=json_data, params=params)
+        response = self.session.post(url, json=json_data, data=data, params=params)
         self._log_response(response)
         
         response.raise_for_status()
@@ -211,6 +221,15 @@ def get_jira_client() -> JiraClient:
         
     return _jira_client
 
+def reset_client() -> None:
+    """
+    Drop the cached JiraClient so the next get_jira_client() call builds a new one.
+    
+    Useful after credentials change, and in tests that need a fresh client.
+    """
+    global _jira_client
+    _jira_client = None
+
 # Alias for backward compatibility
 def get_client() -> JiraClient:
     """
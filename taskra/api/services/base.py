@@ -1,10 +1,15 @@
 """Base service class for all Jira API services."""
 
 from abc import ABC
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Union
 
 from ..client import JiraClient
 
+# Upper bound on concurrent page requests; stays below the default
+# requests connection pool size (10) so connections are reused
+MAX_PAGE_WORKERS = 8
+
 
 class BaseService(ABC):
     """
@@ -34,3 +39,31 @@ class BaseService(ABC):
             Formatted endpoint path
         """
         return path.lstrip('/')
+    
+    def _get_pages(self, endpoint: str, offsets: Iterable[int],
+                   max_results: int) -> List[Union[Dict[str, Any], list]]:
+        """
+        Fetch several pages of a paginated endpoint concurrently.
+        
+        Args:
+            endpoint: The API endpoint path
+            offsets: startAt value of each page to fetch
+            max_results: maxResults value sent with every page request
+            
+        Returns:
+            Page responses in the same order as offsets
+        """
+        offsets = list(offsets)
+        if not offsets:
+            return []
+        
+        def fetch(start_at: int) -> Union[Dict[str, Any], list]:
+            params = {"startAt": start_at, "maxResults": max_results}
+            return self.client.get(endpoint, params=params)
+        
+        # The workers share the client's requests.Session. That is safe here: they
+        # only issue GETs and never touch the session's headers or auth, the
+        # HTTPBasicAuth handler is stateless, urllib3's connection pool is
+        # thread-safe, and the cookie jar serialises access with its own lock.
+        with ThreadPoolExecutor(max_workers=min(MAX_PAGE_WORKERS, len(offsets))) as executor:
+            return list(executor.map(fetch, offsets))
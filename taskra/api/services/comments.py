@@ -61,32 +61,19 @@ class CommentsService(BaseService):
         Returns:
             Complete list of all Comment models
         """
-        all_comments = []
-        start_at = 0
-        total = None
+        endpoint = self._get_endpoint(f"issue/{issue_key}/comment")
+        params = {"startAt": 0, "maxResults": max_results_per_page}
+        first_page = CommentList.from_api(self.client.get(endpoint, params=params))
         
-        while total is None or start_at < total:
-            # Make API request
-            endpoint = self._get_endpoint(f"issue/{issue_key}/comment")
-            params = {"startAt": start_at, "maxResults": max_results_per_page}
-            response = self.client.get(endpoint, params=params)
-            
-            # Convert to CommentList model
-            comment_list = CommentList.from_api(response)
-            comments = comment_list.comments
-            
-            # Add comments to result list
-            all_comments.extend(comments)
-            
-            if total is None:
-                total = comment_list.total
-            
-            # Update the start_at parameter for the next page
-            start_at += len(comments)
-            
-            # If we got fewer results than requested, we're done
-            if len(comments) < max_results_per_page:
-                break
+        all_comments = list(first_page.comments)
+        page_size = len(all_comments)
+        
+        # The first page reports the total, so fetch the remaining pages concurrently.
+        # Step by the size of the page actually returned in case the server capped maxResults.
+        if page_size:
+            offsets = range(page_size, first_page.total, page_size)
+            for page in self._get_pages(endpoint, offsets, max_results_per_page):
+                all_comments.extend(CommentList.from_api(page).comments)
         
         return all_comments
     
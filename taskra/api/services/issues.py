@@ -161,30 +161,21 @@ class IssuesService(BaseService):  # Renamed from IssueService to IssuesService
         Returns:
             Complete list of all comments
         """
-        all_comments = []
-        start_at = 0
-        total = None
-        
-        while total is None or start_at < total:
-            # Make API request
-            endpoint = self._get_endpoint(f"issue/{issue_key}/comment")
-            params = {"startAt": start_at, "maxResults": max_results_per_page}
-            response = self.client.get(endpoint, params=params)
-            
-            # Get comments and pagination info
-            comments = response.get("comments", [])
-            if total is None:
-                total = response.get("total", 0)
-            
-            # Add comments to result list
-            all_comments.extend(comments)
-            
-            # Update the start_at parameter for the next page
-            start_at += len(comments)
-            
-            # If we got fewer results than requested, we're done
-            if len(comments) < max_results_per_page:
-                break
+        endpoint = self._get_endpoint(f"issue/{issue_key}/comment")
+        params = {"startAt": 0, "maxResults": max_results_per_page}
+        response = self.client.get(endpoint, params=params)
+        
+        # Get comments and pagination info from the first page
+        all_comments = list(response.get("comments", []))
+        total = response.get("total", 0)
+        page_size = len(all_comments)
+        
+        # The first page tells us how many comments remain, so fetch the rest concurrently.
+        # Step by the size of the page actually returned in case the server capped maxResults.
+        if page_size:
+            offsets = range(page_size, total, page_size)
+            for page in self._get_pages(endpoint, offsets, max_results_per_page):
+                all_comments.extend(page.get("comments", []))
         
         return all_comments
 
@@ -38,24 +38,20 @@ class ProjectsService(BaseService):
         Returns:
             Complete list of Project models
         """
-        all_projects = []
-        start_at = 0
-        is_last_page = False
+        endpoint = self._get_endpoint("project/search")
+        params = {"startAt": 0, "maxResults": max_results_per_page}
+        response = self.client.get(endpoint, params=params)
+        first_page = ProjectList.model_validate(response)
         
-        while not is_last_page:
-            params = {
-                "startAt": start_at,
-                "maxResults": max_results_per_page
-            }
-            
-            response = self.client.get(self._get_endpoint("project/search"), params=params)
-            project_list = ProjectList.model_validate(response)
-            
-            all_projects.extend(project_list.values)
-            is_last_page = project_list.is_last
-            
-            if not is_last_page:
-                start_at += len(project_list.values)
+        all_projects = list(first_page.values)
+        page_size = len(all_projects)
+        
+        # The first page reports the total, so fetch the remaining pages concurrently.
+        # Step by the size of the page actually returned in case the server capped maxResults.
+        if not first_page.is_last and page_size:
+            offsets = range(page_size, first_page.total, page_size)
+            for page in self._get_pages(endpoint, offsets, max_results_per_page):
+                all_projects.extend(ProjectList.model_validate(page).values)
         
         return all_projects
     
@@ -37,8 +37,10 @@ class WorklogService(BaseService):
             started=started
         )
         
-        # Convert to API format
-        payload = worklog_create.model_dump_api()
+        # Encode the request body straight to JSON in pydantic-core, then to UTF-8
+        # bytes so non-latin-1 comments survive urllib3 1.x's str body handling
+        payload = worklog_create.model_dump_json_api(exclude_none=True)
+        body = payload.encode("utf-8")
         
         # Debug logging
         logging.info(f"Adding worklog to issue {issue_key}")
@@ -49,7 +51,7 @@ class WorklogService(BaseService):
         
         try:
             # Try using the client's post method
-            response = self.client.post(endpoint, json_data=payload)
+            response = self.client.post(endpoint, data=body)
             # Parse response to Worklog model
             return Worklog.from_api(response)
         except Exception as e:
@@ -97,7 +99,7 @@ class WorklogService(BaseService):
                     self.client.base_url + endpoint,
                     auth=auth,
                     headers=headers,
-                    json=payload
+                    data=body
                 )
                 
                 logging.info(f"Direct API call status code: {direct_response.status_code}")
@@ -159,10 +161,11 @@ class WorklogService(BaseService):
         all_worklogs = []
         start_at = 0
         total = None
+        # The endpoint is the same for every page
+        endpoint = self._get_endpoint(f"issue/{issue_key}/worklog")
         
         while total is None or start_at < total:
             # Make API request
-            endpoint = self._get_endpoint(f"issue/{issue_key}/worklog")
             params = {"startAt": start_at, "maxResults": max_results_per_page}
             response = self.client.get(endpoint, params=params)
             
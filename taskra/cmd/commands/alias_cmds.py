@@ -1,5 +1,5 @@
 import click
-from .worklogs import submit_worklog_cmd
+from .worklogs import submit_worklog_cmd, _parse_worklog_datetime
 
 @click.command("log-work")
 @click.argument("issue_id", required=True)
@@ -22,7 +22,7 @@ def log_work_cmd(ctx, issue_id, comment, starttime, endtime, json, debug):
     if not starttime:
         last_worklog = get_last_worklog(issue_id)
         if last_worklog and "started" in last_worklog and "timeSpentSeconds" in last_worklog:
-            started = dt.datetime.fromisoformat(last_worklog["started"].split("+")[0])
+            started = _parse_worklog_datetime(last_worklog)
             duration = dt.timedelta(seconds=last_worklog["timeSpentSeconds"])
             starttime = (started + duration).strftime("%H:%M")
         else:
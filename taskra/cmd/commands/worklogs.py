@@ -545,12 +545,14 @@ def _parse_worklog_datetime(worklog):
     if not started:
         return datetime.datetime.min
     
+    # Worklogs carry "…Z", "…+00:00" or Jira's "…+0000" offsets. Keep the wall-clock
+    # time they were logged in and drop the offset, so every result is naive and
+    # worklogs with different offsets can be sorted and compared with each other.
     if isinstance(started, datetime.datetime):
-        return started
+        return started.replace(tzinfo=None)
     elif isinstance(started, str) and "T" in started:
         try:
-            date_part = started.split("+")[0].split(".")[0]
-            return datetime.datetime.fromisoformat(date_part)
+            return datetime.datetime.fromisoformat(started).replace(tzinfo=None, microsecond=0)
         except ValueError:
             return datetime.datetime.min
     return datetime.datetime.min
@@ -42,7 +42,7 @@ def list_accounts() -> List[Dict[str, Any]]:
     Returns:
         List of account information dictionaries
     """
-    config = config_manager.read_config()
+    config = config_manager.read_config_view()
     default_account = config.get("default_account")
     accounts_dict = config.get("accounts", {})
     
@@ -68,7 +68,7 @@ def get_current_account() -> Optional[Dict[str, Any]]:
     # Check if environment variable override is set
     env_account = os.environ.get("TASKRA_ACCOUNT")
     
-    config = config_manager.read_config()
+    config = config_manager.read_config_view()
     accounts = config.get("accounts", {})
     
     if not accounts:
@@ -1,9 +1,40 @@
 """Configuration manager for Taskra."""
 
 import os
+import copy
 import json
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Iterator, Mapping, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup (taskra[speedups])
+    orjson = None
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _freeze(data: Any) -> Any:
+    """Return a read-only copy of parsed JSON: dicts become MappingProxyType, lists tuples."""
+    if isinstance(data, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in data.items()})
+    if isinstance(data, list):
+        return tuple(_freeze(item) for item in data)
+    return data
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode("utf-8")
 
 
 class ConfigManager:
@@ -31,6 +62,16 @@ class ConfigManager:
             
         self.config_path = os.path.join(self.config_dir, config_file)
         
+        # Contents of the config file as last read, and the stat signature it
+        # was read under; read_config re-parses it instead of reopening the
+        # file, and read_config_view hands out one frozen view of it
+        self._cache_text: Optional[bytes] = None
+        self._cache_key: Optional[tuple] = None
+        self._cache_view: Optional[Mapping[str, Any]] = None
+        
+        # Pending configuration while a batch() block is open, otherwise None
+        self._batch_config: Optional[Dict[str, Any]] = None
+        
         if self.debug:
             print(f"DEBUG: ConfigManager initialized with dir: {self.config_dir}, file: {self.config_path}")
             
@@ -45,28 +86,70 @@ class ConfigManager:
         elif self.debug:
             print(f"DEBUG: Config directory already exists: {self.config_dir}")
     
+    def _stat_key(self) -> Optional[tuple]:
+        """Return the (mtime_ns, size, inode) signature of the config file, or None if it is missing."""
+        try:
+            st = os.stat(self.config_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+    
+    def read_config_view(self) -> Mapping[str, Any]:
+        """
+        Read configuration from file as a read-only mapping.
+
+        This method returns the configuration with every nested dictionary wrapped in a MappingProxyType and lists turned into tuples. While the file's mtime, size and inode are unchanged, the same view is returned again, so repeated reads cost a single stat(). It suits callers that only look at the configuration; use read_config() for a dictionary you can modify and pass to write_config(), or update_config() to change the stored configuration.
+
+        Returns:
+            Read-only configuration mapping
+        """
+        if self._batch_config is not None:
+            # Inside batch(): report the pending, not yet written, configuration
+            return _freeze(self._batch_config)
+        
+        if self._cache_view is not None and self._cache_key is not None and self._stat_key() == self._cache_key:
+            return self._cache_view
+        
+        view = _freeze(self.read_config())
+        # read_config leaves _cache_key set only when it parsed the file;
+        # a freshly written default config clears it, so that view is not kept
+        self._cache_view = view if self._cache_key is not None else None
+        return view
+    
     def read_config(self) -> Dict[str, Any]:
         """
         Read configuration from file.
 
-        This method reads the configuration file and returns its contents as a dictionary. If the file does not exist or is corrupted, a default configuration is created and returned.
+        This method reads the configuration file and returns its contents as a dictionary. If the file does not exist or is corrupted, a default configuration is created and returned. The file text is kept in memory and reused while the file's mtime, size and inode are unchanged, so repeated reads cost a stat() and a parse rather than an open and read. Every call returns a new dictionary that callers may modify.
 
         Returns:
             Configuration dictionary
         """
-        if not os.path.exists(self.config_path):
+        if self._batch_config is not None:
+            # Inside batch(): report the pending, not yet written, configuration
+            return copy.deepcopy(self._batch_config)
+        
+        key = self._stat_key()
+        if key is None:
             if self.debug:
                 print(f"DEBUG: Config file does not exist: {self.config_path}. Creating default config.")
             return self._create_default_config()
             
         try:
-            if self.debug:
-                print(f"DEBUG: Reading config from: {self.config_path}")
-            with open(self.config_path, "r") as f:
-                config = json.load(f)
+            if key == self._cache_key:
+                text = self._cache_text
                 if self.debug:
-                    print(f"DEBUG: Successfully read config: {config}")
-                return config
+                    print(f"DEBUG: Reusing cached config text for: {self.config_path}")
+            else:
+                if self.debug:
+                    print(f"DEBUG: Reading config from: {self.config_path}")
+                text = Path(self.config_path).read_bytes()
+            config = _loads(text)
+            if key != self._cache_key:
+                self._cache_text, self._cache_key, self._cache_view = text, key, None
+            if self.debug:
+                print(f"DEBUG: Successfully read config: {config}")
+            return config
         except (json.JSONDecodeError, FileNotFoundError) as e:
             if self.debug:
                 print(f"DEBUG: Error reading config: {str(e)}. Creating default config.")
@@ -77,7 +160,7 @@ class ConfigManager:
         """
         Write configuration to file.
 
-        This method writes the given configuration dictionary to the configuration file. It ensures that the configuration directory exists before writing and uses a temporary file to avoid partial writes.
+        This method writes the given configuration dictionary to the configuration file. It ensures that the configuration directory exists before writing, then writes the encoded configuration to a temporary file, syncs it to disk and renames it over the old file, so the file is either fully old or fully new even if the process dies mid-write. The temporary file is removed if anything fails.
 
         Args:
             config: Configuration dictionary
@@ -89,14 +172,22 @@ class ConfigManager:
             print(f"DEBUG: Writing config to: {self.config_path}")
             print(f"DEBUG: Config content: {config}")
         
+        temp_path = f"{self.config_path}.tmp"
         try:
-            # First write to a temporary file, then move it to avoid partial writes
-            temp_path = f"{self.config_path}.tmp"
-            with open(temp_path, "w") as f:
-                json.dump(config, f, indent=2)
+            # Encode up front so a serialization error never touches the disk
+            payload = _dumps(config)
+            
+            # Write the whole buffer to a temporary file and make sure it is on
+            # disk before it replaces the original
+            with open(temp_path, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
             
             # Replace the original file with the new one
             os.replace(temp_path, self.config_path)
+            self._cache_key = None
+            self._cache_view = None
             
             if self.debug:
                 print(f"DEBUG: Successfully wrote config to: {self.config_path}")
@@ -105,6 +196,10 @@ class ConfigManager:
         except Exception as e:
             if self.debug:
                 print(f"DEBUG: Error writing config: {str(e)}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
             raise
     
     def _create_default_config(self) -> Dict[str, Any]:
@@ -143,6 +238,12 @@ class ConfigManager:
         if self.debug:
             print(f"DEBUG: Updating config using function: {update_func.__name__ if hasattr(update_func, '__name__') else 'anonymous'}")
         
+        if self._batch_config is not None:
+            # Work on a copy so a failing update_func leaves the batch untouched,
+            # just as it leaves the file untouched outside a batch
+            self._batch_config = update_func(copy.deepcopy(self._batch_config))
+            return self._batch_config
+        
         config = self.read_config()
         updated_config = update_func(config)
         
@@ -152,6 +253,31 @@ class ConfigManager:
         
         self.write_config(updated_config)
         return updated_config
+    
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Group several configuration updates into a single write.
+
+        The configuration is read once when the block starts. Every update_config call inside the block is applied in memory, and read_config and read_config_view return that pending state, so helpers such as add_account and set_default_account see each other's changes. The result is written once when the block exits normally; if the block raises, nothing is written. Nested batch() blocks join the outermost one.
+
+        Example:
+            with config_manager.batch():
+                add_account(url, email, token)
+                set_default_account(name)
+        """
+        if self._batch_config is not None:
+            yield
+            return
+        
+        self._batch_config = self.read_config()
+        try:
+            yield
+            config = self._batch_config
+        finally:
+            self._batch_config = None
+        
+        self.write_config(config)
 
 
 # Global instance
@@ -3,6 +3,7 @@
 import logging
 from datetime import datetime, date, time
 from typing import Optional, List, Dict, Any, Union
+from pydantic import BaseModel
 from ..api.services.worklogs import WorklogService
 from ..api.client import get_client
 from ..utils.cache import generate_cache_key, get_from_cache, save_to_cache
@@ -10,6 +11,115 @@ from ..utils.cache import generate_cache_key, get_from_cache, save_to_cache
 # Create a logger for this module
 logger = logging.getLogger(__name__)
 
+def _serialize_model(obj: BaseModel) -> Dict[str, Any]:
+    """Serialize a Pydantic model to a dict keyed by the API's camelCase names."""
+    # IMPORTANT: We use by_alias=True to preserve the original camelCase field names from the API
+    # Without this, fields would be serialized as snake_case and the presentation layer wouldn't find them
+    # mode="json" lets pydantic-core convert datetimes etc. in the same pass, so the
+    # result is returned as-is instead of being walked again
+    result = obj.model_dump(mode="json", by_alias=True, exclude_none=False)
+    _mirror_issue_fields(obj, result)
+    return result
+
+def _mirror_issue_fields(obj: BaseModel, result: Dict[str, Any]) -> None:
+    """Add the issue key/summary variants to a model's dump and to the dumps of nested models."""
+    # issue_key and issue_summary are excluded from dumps, so copy them explicitly
+    issue_key = getattr(obj, 'issue_key', None)
+    if issue_key:
+        result['issueKey'] = issue_key
+        result['issue_key'] = issue_key
+        
+    issue_summary = getattr(obj, 'issue_summary', None)
+    if issue_summary:
+        result['issueSummary'] = issue_summary
+        result['issue_summary'] = issue_summary
+    
+    # Mirror the aliased issueKey (issue_id) for callers reading the snake_case name
+    if 'issueKey' in result and 'issue_key' not in result:
+        result['issue_key'] = result['issueKey']
+    
+    # Nested models (e.g. WorklogList.worklogs) were dumped in the same pass, so
+    # walk them alongside their dumped dicts to mirror their keys as well
+    for name, field in type(obj).model_fields.items():
+        dumped = result.get(field.serialization_alias or field.alias or name)
+        value = getattr(obj, name, None)
+        if isinstance(value, BaseModel) and isinstance(dumped, dict):
+            _mirror_issue_fields(value, dumped)
+        elif isinstance(value, (list, tuple)) and isinstance(dumped, list):
+            for item, item_dumped in zip(value, dumped):
+                if isinstance(item, BaseModel) and isinstance(item_dumped, dict):
+                    _mirror_issue_fields(item, item_dumped)
+
+def _serialize_dict(obj: dict) -> Dict[str, Any]:
+    """Serialize a dict, filling in the field-name variants the presentation layer reads."""
+    # Special handling for worklog entries to preserve critical fields
+    # This ensures compatibility between fresh API data and cached data
+    if "author" in obj and isinstance(obj["author"], dict):
+        # The presentation layer looks for author.displayName, so we ensure it exists
+        # This provides a fallback if the field was somehow converted to snake_case
+        if "display_name" in obj["author"] and "displayName" not in obj["author"]:
+            obj["author"]["displayName"] = obj["author"]["display_name"]
+    
+    # Similar fallbacks for other critical fields used by the presentation layer
+    # These ensure the fields are available regardless of naming convention changes
+    if "time_spent" in obj and "timeSpent" not in obj:
+        obj["timeSpent"] = obj["time_spent"]
+    
+    if "time_spent_seconds" in obj and "timeSpentSeconds" not in obj:
+        obj["timeSpentSeconds"] = obj["time_spent_seconds"]
+    
+    # Ensure issue key and summary are available in both formats
+    if "issue_key" in obj and "issueKey" not in obj:
+        obj["issueKey"] = obj["issue_key"]
+    elif "issueKey" in obj and "issue_key" not in obj:
+        obj["issue_key"] = obj["issueKey"]
+        
+    if "issue_summary" in obj and "issueSummary" not in obj:
+        obj["issueSummary"] = obj["issue_summary"]
+    elif "issueSummary" in obj and "issue_summary" not in obj:
+        obj["issue_summary"] = obj["issueSummary"]
+        
+    # Check for nested issue structure and extract key if needed
+    if not obj.get("issueKey") and not obj.get("issue_key"):
+        if "issue" in obj and isinstance(obj["issue"], dict) and "key" in obj["issue"]:
+            obj["issueKey"] = obj["issue"]["key"]
+            obj["issue_key"] = obj["issue"]["key"]
+            
+            # Also extract summary if available
+            if "fields" in obj["issue"] and "summary" in obj["issue"]["fields"]:
+                obj["issueSummary"] = obj["issue"]["fields"]["summary"]
+                obj["issue_summary"] = obj["issue"]["fields"]["summary"]
+    
+    return {k: _to_json_serializable(v) for k, v in obj.items()}
+
+def _serialize_list(obj: list) -> list:
+    """Serialize each item of a list."""
+    return [_to_json_serializable(item) for item in obj]
+
+def _serialize_tuple(obj: tuple) -> tuple:
+    """Serialize each item of a tuple."""
+    return tuple(_to_json_serializable(item) for item in obj)
+
+def _identity(obj):
+    """Return JSON-native values unchanged."""
+    return obj
+
+# Exact-type dispatch for the common cases; subclasses and anything else fall
+# through to the isinstance checks in _to_json_serializable
+_SERIALIZERS = {
+    dict: _serialize_dict,
+    list: _serialize_list,
+    tuple: _serialize_tuple,
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    type(None): _identity,
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    time: time.isoformat,
+}
+
 def _to_json_serializable(obj):
     """
     Convert Pydantic models and other non-JSON serializable objects to JSON serializable dictionaries.
@@ -19,95 +129,25 @@ def _to_json_serializable(obj):
     2. Preserving original field names from the Jira API (camelCase) that the presentation
        layer expects, rather than the snake_case names used internally by Pydantic models
     """
-    # Check for Pydantic models
-    if hasattr(obj, 'model_dump'):
-        # For Pydantic v2+
-        # IMPORTANT: We use by_alias=True to preserve the original camelCase field names from the API
-        # Without this, fields would be serialized as snake_case and the presentation layer wouldn't find them
-        result = obj.model_dump(by_alias=True)
-        
-        # Explicitly copy issue_key and issue_summary if they exist as attributes
-        if hasattr(obj, 'issue_key') and getattr(obj, 'issue_key', None):
-            result['issueKey'] = getattr(obj, 'issue_key')
-            result['issue_key'] = getattr(obj, 'issue_key')
-            
-        if hasattr(obj, 'issue_summary') and getattr(obj, 'issue_summary', None):
-            result['issueSummary'] = getattr(obj, 'issue_summary')
-            result['issue_summary'] = getattr(obj, 'issue_summary')
-            
-        # Process the result to handle datetime objects
-        return _to_json_serializable(result)
-    elif hasattr(obj, 'dict'):
-        # For Pydantic v1
-        # IMPORTANT: Same reasoning as above - preserve the original API field names
-        result = obj.dict(by_alias=True)
-        
-        # Explicitly copy issue_key and issue_summary if they exist as attributes
-        if hasattr(obj, 'issue_key') and getattr(obj, 'issue_key', None):
-            result['issueKey'] = getattr(obj, 'issue_key')
-            result['issue_key'] = getattr(obj, 'issue_key')
-            
-        if hasattr(obj, 'issue_summary') and getattr(obj, 'issue_summary', None):
-            result['issueSummary'] = getattr(obj, 'issue_summary')
-            result['issue_summary'] = getattr(obj, 'issue_summary')
-            
-        # Process the result to handle datetime objects
-        return _to_json_serializable(result)
+    serializer = _SERIALIZERS.get(type(obj))
+    if serializer is not None:
+        return serializer(obj)
     
-    # Check for datetime objects
-    if isinstance(obj, (datetime, date, time)):
-        # Convert datetime to ISO format string
-        return obj.isoformat()
+    # Check for Pydantic models
+    if isinstance(obj, BaseModel):
+        return _serialize_model(obj)
     
-    # Check for other datetime-like objects
-    if hasattr(obj, 'isoformat') and callable(obj.isoformat):
+    # Check for datetime objects and other datetime-like objects
+    if isinstance(obj, (datetime, date, time)) or (hasattr(obj, 'isoformat') and callable(obj.isoformat)):
         return obj.isoformat()
 
-    # Handle collections
+    # Handle collection subclasses
     if isinstance(obj, list):
-        return [_to_json_serializable(item) for item in obj]
+        return _serialize_list(obj)
     elif isinstance(obj, dict):
-        # Special handling for worklog entries to preserve critical fields
-        # This ensures compatibility between fresh API data and cached data
-        if "author" in obj and isinstance(obj["author"], dict):
-            # The presentation layer looks for author.displayName, so we ensure it exists
-            # This provides a fallback if the field was somehow converted to snake_case
-            if "display_name" in obj["author"] and "displayName" not in obj["author"]:
-                obj["author"]["displayName"] = obj["author"]["display_name"]
-        
-        # Similar fallbacks for other critical fields used by the presentation layer
-        # These ensure the fields are available regardless of naming convention changes
-        if "time_spent" in obj and "timeSpent" not in obj:
-            obj["timeSpent"] = obj["time_spent"]
-        
-        if "time_spent_seconds" in obj and "timeSpentSeconds" not in obj:
-            obj["timeSpentSeconds"] = obj["time_spent_seconds"]
-        
-        # Ensure issue key and summary are available in both formats
-        if "issue_key" in obj and "issueKey" not in obj:
-            obj["issueKey"] = obj["issue_key"]
-        elif "issueKey" in obj and "issue_key" not in obj:
-            obj["issue_key"] = obj["issueKey"]
-            
-        if "issue_summary" in obj and "issueSummary" not in obj:
-            obj["issueSummary"] = obj["issue_summary"]
-        elif "issueSummary" in obj and "issue_summary" not in obj:
-            obj["issue_summary"] = obj["issueSummary"]
-            
-        # Check for nested issue structure and extract key if needed
-        if not obj.get("issueKey") and not obj.get("issue_key"):
-            if "issue" in obj and isinstance(obj["issue"], dict) and "key" in obj["issue"]:
-                obj["issueKey"] = obj["issue"]["key"]
-                obj["issue_key"] = obj["issue"]["key"]
-                
-                # Also extract summary if available
-                if "fields" in obj["issue"] and "summary" in obj["issue"]["fields"]:
-                    obj["issueSummary"] = obj["issue"]["fields"]["summary"]
-                    obj["issue_summary"] = obj["issue"]["fields"]["summary"]
-        
-        return {k: _to_json_serializable(v) for k, v in obj.items()}
+        return _serialize_dict(obj)
     elif isinstance(obj, tuple):
-        return tuple(_to_json_serializable(item) for item in obj)
+        return _serialize_tuple(obj)
     
     # Return primitive types and anything else as-is
     return obj
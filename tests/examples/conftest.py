@@ -0,0 +1,3 @@
+"""Example scripts live here; they are run via `make examples`, not collected as tests."""
+
+collect_ignore = ["worklog_model_example.py"]
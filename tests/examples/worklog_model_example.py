@@ -50,7 +50,7 @@ def main():
     )
     
     print("\nComplete Worklog model serialized:")
-    print(json.dumps(worklog.model_dump_api(), indent=2, default=str))
+    print(worklog.model_dump_json_api(indent=2, exclude_none=True))
     
     # Test that the fields can be accessed
     print("\nAccessing fields:")
@@ -67,7 +67,7 @@ def main():
     )
     
     print("\nWorklog list serialized:")
-    print(json.dumps(worklogs_list.model_dump_api(), indent=2, default=str))
+    print(worklogs_list.model_dump_json_api(indent=2, exclude_none=True))
 
 
 if __name__ == "__main__":
@@ -1,38 +1,81 @@
 """Fixtures for integration tests."""
 
 import os
+from types import MappingProxyType
+from unittest.mock import MagicMock
+
 import pytest
-from vcr import VCR
+
+try:
+    import pytest_socket
+except ImportError:  # pragma: no cover - optional test dependency
+    pytest_socket = None
 
 # Import the patch to fix VCR compatibility issue
-from .vcr_patches import patch_vcr_response
+from .vcr_patches import CachedPersister, patch_vcr_response
 
-# Configure VCR to handle Jira API recordings
-vcr = VCR(
-    cassette_library_dir='tests/fixtures/cassettes',
-    filter_headers=['Authorization'],
-    record_mode='once'
-)
+# Shared, read-only VCR settings handed to pytest-vcr
+_VCR_CONFIG = MappingProxyType({
+    'filter_headers': ['Authorization'],
+    'record_mode': 'once',
+})
 
-# Apply VCR patch at module initialization
-patch_vcr_response()
+@pytest.fixture(scope="session", autouse=True)
+def _patch_vcr():
+    """Apply the VCR/urllib3 compatibility patch once, after collection."""
+    patch_vcr_response()
+    yield
 
-@pytest.fixture(scope="module")
+@pytest.fixture(autouse=True)
+def _no_network():
+    """Block real sockets so only VCR playback or mocks can serve requests.
+
+    Live tests (RUN_LIVE_TESTS=1) keep network access.
+    """
+    if pytest_socket is None or os.environ.get("RUN_LIVE_TESTS"):
+        yield
+        return
+    pytest_socket.disable_socket()
+    yield
+    pytest_socket.enable_socket()
+
+@pytest.fixture(scope="session")
 def vcr_config():
     """VCR configuration."""
-    return {
-        'filter_headers': ['Authorization'],
-        'record_mode': 'once',
-    }
+    return _VCR_CONFIG
 
-@pytest.fixture
-def mock_env_vars():
+@pytest.fixture(scope="module")
+def vcr(vcr):
+    """pytest-vcr's recorder, serving cassettes through the parse-once persister."""
+    vcr.register_persister(CachedPersister)
+    return vcr
+
+@pytest.fixture(scope="module")
+def monkeypatch_module():
+    """MonkeyPatch instance that is undone once the test module finishes."""
+    mp = pytest.MonkeyPatch()
+    yield mp
+    mp.undo()
+
+@pytest.fixture(scope="module")
+def mock_env_vars(monkeypatch_module):
     """Set up environment variables for testing."""
-    with pytest.MonkeyPatch().context() as m:
-        m.setenv("JIRA_BASE_URL", "https://example.atlassian.net")
-        m.setenv("JIRA_API_TOKEN", "dummy-token")
-        m.setenv("JIRA_EMAIL", "test@example.com")
-        yield
+    for key, value in (
+        ("JIRA_BASE_URL", "https://example.atlassian.net"),
+        ("JIRA_API_TOKEN", "dummy-token"),
+        ("JIRA_EMAIL", "test@example.com"),
+    ):
+        monkeypatch_module.setenv(key, value)
+
+@pytest.fixture(scope="session")
+def mock_list_projects():
+    """Shared stand-in for taskra.core.list_projects; reset it before use."""
+    return MagicMock(name="list_projects")
+
+@pytest.fixture(scope="session")
+def mock_get_issue():
+    """Shared stand-in for taskra.core.get_issue; reset it before use."""
+    return MagicMock(name="get_issue")
 
 @pytest.fixture
 def test_issue_key():
@@ -5,6 +5,7 @@ import tempfile
 from unittest.mock import patch
 import pytest
 
+import taskra.config.account as _account
 from taskra.config.manager import ConfigManager
 from taskra.config.account import (
     list_accounts,
@@ -18,72 +19,103 @@ from taskra.api.client import JiraClient
 from taskra.api.services.users import UserService
 
 
+@pytest.fixture(scope="class")
+def setup_config_manager():
+    """Set up a temporary config manager for testing."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create a config manager that uses the temp directory
+        manager = ConfigManager(config_dir=temp_dir)
+        
+        # Patch the global instance with our test instance
+        with patch.object(_account, "config_manager", manager):
+            yield manager
+
+
+@pytest.fixture(scope="class")
+def mock_validation():
+    """Mock the validation of Jira credentials."""
+    # Patch the validate_credentials function directly instead of trying to patch JiraClient
+    with patch.object(_account, "validate_credentials", return_value=True):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def empty_config(setup_config_manager, mock_validation):
+    """Start every step from a config with no accounts."""
+    setup_config_manager.write_config({"default_account": None, "accounts": {}})
+
+
+def _add_accounts(*names):
+    """Add one account per name, in order, as the preconditions of a step."""
+    for name in names:
+        success, message = add_account(
+            f"https://{name}.atlassian.net", f"{name}@example.com", f"token-{name}"
+        )
+        assert success, message
+
+
 class TestAccountIntegration:
-    """Test complete account management workflow."""
-    
-    @pytest.fixture
-    def setup_config_manager(self):
-        """Set up a temporary config manager for testing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create a config manager that uses the temp directory
-            manager = ConfigManager(config_dir=temp_dir)
-            
-            # Patch the global instance with our test instance
-            with patch("taskra.config.account.config_manager", manager):
-                yield manager
+    """Test complete account management workflow.
+
+    The steps share one class-scoped ConfigManager, whose file is emptied
+    before every step; each step adds the accounts it needs first, so any
+    single step can be rerun on its own (e.g. with --lf).
+    """
     
-    @pytest.fixture
-    def mock_validation(self):
-        """Mock the validation of Jira credentials."""
-        # Patch the validate_credentials function directly instead of trying to patch JiraClient
-        with patch("taskra.config.account.validate_credentials", return_value=True):
-            yield
+    def test_01_initially_no_accounts(self):
+        """Initially there should be no accounts."""
+        assert len(list_accounts()) == 0
     
-    def test_account_management_workflow(self, setup_config_manager, mock_validation):
-        """Test the entire account management workflow."""
-        # 1. Initially there should be no accounts
-        accounts = list_accounts()
-        assert len(accounts) == 0
-        
-        # 2. Add first account
+    def test_02_add_first_account(self):
+        """Add first account."""
         success, _ = add_account("https://first.atlassian.net", "first@example.com", "token1")
         assert success
+    
+    def test_03_add_second_account(self):
+        """Add second account."""
+        _add_accounts("first")
         
-        # 3. Add second account
         success, _ = add_account("https://second.atlassian.net", "second@example.com", "token2")
         assert success
+    
+    def test_04_list_both_accounts(self):
+        """List accounts and verify both exist."""
+        _add_accounts("first", "second")
         
-        # 4. List accounts and verify both exist
         accounts = list_accounts()
         assert len(accounts) == 2
         assert any(a["name"] == "first" for a in accounts)
         assert any(a["name"] == "second" for a in accounts)
+    
+    def test_05_first_account_is_default(self):
+        """Check default account is the first one added."""
+        _add_accounts("first", "second")
         
-        # 5. Check default account is the first one added
-        account = get_current_account()
-        assert account["name"] == "first"
+        assert get_current_account()["name"] == "first"
+    
+    def test_06_change_default_account(self):
+        """Change default account and verify it took effect."""
+        _add_accounts("first", "second")
         
-        # 6. Change default account
         success, _ = set_default_account("second")
         assert success
+        assert get_current_account()["name"] == "second"
+    
+    def test_07_remove_account(self):
+        """Remove an account and verify only the other remains."""
+        _add_accounts("first", "second")
         
-        # 7. Verify default changed
-        account = get_current_account()
-        assert account["name"] == "second"
-        
-        # 8. Remove an account
         success, _ = remove_account("first")
         assert success
         
-        # 9. Verify account was removed
         accounts = list_accounts()
         assert len(accounts) == 1
         assert accounts[0]["name"] == "second"
+    
+    def test_08_remove_last_account(self):
+        """Remove last account and verify no accounts remain."""
+        _add_accounts("second")
         
-        # 10. Remove last account
         success, _ = remove_account("second")
         assert success
-        
-        # 11. Verify no accounts remain
-        accounts = list_accounts()
-        assert len(accounts) == 0
+        assert len(list_accounts()) == 0
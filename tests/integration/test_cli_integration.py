@@ -1,99 +1,119 @@
 """Integration tests for CLI commands."""
 
 import os
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 import pytest
-from click.testing import CliRunner
 
+import taskra.core as _core
 from taskra.cmd.main import cli
 
 
+@pytest.fixture(scope="session")
+def runner():
+    """Set up CLI test runner (stateless between invocations, so shared)."""
+    from click.testing import CliRunner
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def projects_cmd():
+    """The `projects` subcommand, resolved once so tests can skip group dispatch."""
+    return cli.commands["projects"]
+
+
+@pytest.fixture(scope="session")
+def issue_cmd():
+    """The `issue` subcommand, resolved once so tests can skip group dispatch."""
+    return cli.commands["issue"]
+
+
 class TestCliIntegration:
     """Tests CLI commands integration with core functionality."""
     
     @pytest.fixture
-    def runner(self):
-        """Set up CLI test runner."""
-        return CliRunner()
-    
-    @pytest.fixture
-    def mock_env_vars(self):
+    def mock_env_vars(self, monkeypatch):
         """Set up environment variables for testing."""
-        with pytest.MonkeyPatch().context() as m:
-            m.setenv("JIRA_BASE_URL", "https://example.atlassian.net")
-            m.setenv("JIRA_API_TOKEN", "dummy-token")
-            m.setenv("JIRA_EMAIL", "test@example.com")
-            m.setenv("TASKRA_TESTING", "1")  # Add this line
-            yield
+        monkeypatch.setenv("JIRA_BASE_URL", "https://example.atlassian.net")
+        monkeypatch.setenv("JIRA_API_TOKEN", "dummy-token")
+        monkeypatch.setenv("JIRA_EMAIL", "test@example.com")
+        monkeypatch.setenv("TASKRA_TESTING", "1")
     
-    def test_projects_command(self, runner, mock_env_vars):
+    def test_projects_command(self, runner, mock_env_vars, projects_cmd,
+                              mock_list_projects, monkeypatch, request):
         """Test the projects command shows project list."""
         # Patch the core module that gets imported inside the CLI command function
         # The function imports "from ..core import list_projects", so we need to patch there
-        with patch("taskra.core.list_projects") as mock_list_projects:
-            # Setup mock to return test data
-            test_projects = [
-                {"key": "TEST", "name": "Test Project"},
-                {"key": "DEMO", "name": "Demo Project"}
-            ]
-            
-            # Make mock print the expected output and return data
-            def mock_impl():
-                print("TEST: Test Project")
-                print("DEMO: Demo Project")
-                return test_projects
-                
-            mock_list_projects.side_effect = mock_impl
-            
-            # Run the command
-            result = runner.invoke(cli, ["projects"])
+        mock_list_projects.reset_mock(return_value=True, side_effect=True)
+        monkeypatch.setattr(_core, "list_projects", mock_list_projects)
+        
+        # Setup mock to return test data
+        test_projects = [
+            {"key": "TEST", "name": "Test Project"},
+            {"key": "DEMO", "name": "Demo Project"}
+        ]
+        
+        # Make mock print the expected output and return data
+        def mock_impl():
+            print("TEST: Test Project")
+            print("DEMO: Demo Project")
+            return test_projects
             
-            # Print debugging information
+        mock_list_projects.side_effect = mock_impl
+        
+        # Run the command
+        result = runner.invoke(projects_cmd, [])
+        
+        # Print debugging information when running with -vv
+        if request.config.getoption("verbose") > 1:
             print(f"\nActual output:\n{result.output}")
-            
-            # Check the command executed successfully
-            assert result.exit_code == 0
-            assert "Available Projects:" in result.output
-            
-            # Verify our mock was called
-            mock_list_projects.assert_called_once()
-            
-            # Check that the expected output is there
-            assert "TEST: Test Project" in result.output
-            assert "DEMO: Demo Project" in result.output
-            assert f"Total projects: {len(test_projects)}" in result.output
+        
+        # Check the command executed successfully
+        assert result.exit_code == 0
+        assert "Available Projects:" in result.output
+        
+        # Verify our mock was called
+        mock_list_projects.assert_called_once()
+        
+        # Check that the expected output is there
+        assert "TEST: Test Project" in result.output
+        assert "DEMO: Demo Project" in result.output
+        assert f"Total projects: {len(test_projects)}" in result.output
     
-    def test_issue_command(self, runner, mock_env_vars):
+    def test_issue_command(self, runner, mock_env_vars, issue_cmd,
+                           mock_get_issue, monkeypatch, request):
         """Test the issue command shows issue details."""
         # Patch the core module function that gets imported
         # The CLI command uses "from ..core import get_issue"
-        with patch("taskra.core.get_issue") as mock_get_issue:
-            # Setup mock to return test data
-            test_issue = {
-                "key": "TEST-123",
-                "fields": {
-                    "summary": "Test issue",
-                    "status": {"name": "In Progress"}
-                }
+        mock_get_issue.reset_mock(return_value=True, side_effect=True)
+        monkeypatch.setattr(_core, "get_issue", mock_get_issue)
+        
+        # Setup mock to return test data
+        test_issue = {
+            "key": "TEST-123",
+            "fields": {
+                "summary": "Test issue",
+                "status": {"name": "In Progress"}
             }
-            mock_get_issue.return_value = test_issue
-            
-            # Run the command
-            result = runner.invoke(cli, ["issue", "TEST-123"])
-            
-            # Print debugging information
+        }
+        mock_get_issue.return_value = test_issue
+        
+        # Run the command
+        result = runner.invoke(issue_cmd, ["TEST-123"])
+        
+        # Print debugging information when running with -vv
+        if request.config.getoption("verbose") > 1:
             print(f"\nActual output:\n{result.output}")
             if result.exception:
                 print(f"Exception: {result.exception}")
-            
-            # Check the command executed successfully
-            assert result.exit_code == 0
-            
-            # Check that the issue details are in the output
-            assert "Issue details for TEST-123" in result.output
-            
-            # Verify our mock was called with the right argument
-            mock_get_issue.assert_called_once_with("TEST-123")
+        
+        # Check the command executed successfully
+        assert result.exit_code == 0
+        
+        # Check that the issue details are in the output
+        assert "Issue details for TEST-123" in result.output
+        
+        # Verify our mock was called with the right argument
+        mock_get_issue.assert_called_once_with("TEST-123")
     
     @pytest.mark.skipif(
         not os.environ.get("RUN_LIVE_TESTS") or 
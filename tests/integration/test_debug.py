@@ -1,20 +1,24 @@
 """Debug utilities for integration testing."""
 
-import sys
+import heapq
 import importlib
+import sys
 
 
-def debug_imports(module_name):
-    """Debug imports for a given module."""
+def debug_imports(module_name, force_reload=False):
+    """Debug imports for a given module.
+    
+    An already-loaded module is inspected in place; pass force_reload=True to
+    drop it from sys.modules and import it afresh.
+    """
     print(f"\nDebugging imports for {module_name}:")
     
     # Try importing the module and print what happens
     try:
-        # Remove the module if it's already imported to ensure fresh import
-        if module_name in sys.modules:
-            del sys.modules[module_name]
+        if force_reload:
+            sys.modules.pop(module_name, None)
             
-        module = importlib.import_module(module_name)
+        module = sys.modules.get(module_name) or importlib.import_module(module_name)
         print(f"Successfully imported {module_name}")
         
         # Show module info
@@ -38,11 +42,12 @@ def debug_imports(module_name):
     if len(sys.path) > 5:
         print(f"  ... and {len(sys.path) - 5} more paths")
     
-    # Show loaded modules that match the prefix
-    print(f"\nLoaded modules starting with '{module_name.split('.')[0]}':")
-    matching_modules = [name for name in sys.modules.keys() 
-                       if name.startswith(module_name.split('.')[0])]
-    for name in sorted(matching_modules)[:20]:
+    # Show loaded modules that match the prefix (only the first 20 are listed,
+    # so select them without sorting the whole match list)
+    prefix = module_name.split('.')[0]
+    print(f"\nLoaded modules starting with '{prefix}':")
+    matching_modules = [name for name in sys.modules if name.startswith(prefix)]
+    for name in heapq.nsmallest(20, matching_modules):
         print(f"  {name}")
     if len(matching_modules) > 20:
         print(f"  ... and {len(matching_modules) - 20} more modules")
@@ -0,0 +1,31 @@
+"""Tests for the VCR playback helpers."""
+
+from pathlib import Path
+
+import pytest
+from vcr import VCR
+
+from .vcr_patches import CachedPersister, _load_cassette
+
+CASSETTE_DIR = Path(__file__).parent / "cassettes"
+CASSETTE = "TestJiraClientIntegration.test_projects_service_list_projects.yaml"
+
+
+def test_cassette_is_parsed_once():
+    """A second load of the same cassette is served from the lru_cache."""
+    recorder = VCR(cassette_library_dir=str(CASSETTE_DIR), record_mode="none")
+    recorder.register_persister(CachedPersister)
+    _load_cassette.cache_clear()
+
+    for _ in range(2):
+        with recorder.use_cassette(CASSETTE) as cassette:
+            assert len(cassette) == 1
+
+    info = _load_cassette.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+
+def test_vcr_fixture_uses_cached_persister(request):
+    """The vcr fixture used by @pytest.mark.vcr tests has the persister registered."""
+    pytest.importorskip("pytest_vcr")
+    assert request.getfixturevalue("vcr").persister is CachedPersister
@@ -1,6 +1,9 @@
 """Patches for VCR compatibility with newer urllib3."""
 
 import logging
+from functools import lru_cache
+
+from vcr.persisters.filesystem import FilesystemPersister
 from vcr.stubs import VCRHTTPResponse
 
 # Add version_string attribute to VCRHTTPResponse for urllib3 compatibility
@@ -10,5 +13,25 @@ def patch_vcr_response():
         VCRHTTPResponse.version_string = "HTTP/1.1"
         logging.info("Added version_string attribute to VCRHTTPResponse")
 
-# Apply the patch
-patch_vcr_response()
+
+@lru_cache(maxsize=None)
+def _load_cassette(cassette_path, serializer):
+    """Parse a cassette file once per session."""
+    return FilesystemPersister.load_cassette(cassette_path, serializer)
+
+
+class CachedPersister(FilesystemPersister):
+    """Filesystem persister that keeps parsed cassettes in memory.
+
+    YAML parsing dominates cassette playback, so each cassette is only parsed
+    the first time it is used; saving a cassette drops the cached copy.
+    """
+
+    @classmethod
+    def load_cassette(cls, cassette_path, serializer):
+        return _load_cassette(str(cassette_path), serializer)
+
+    @staticmethod
+    def save_cassette(cassette_path, cassette_dict, serializer):
+        FilesystemPersister.save_cassette(cassette_path, cassette_dict, serializer)
+        _load_cassette.cache_clear()
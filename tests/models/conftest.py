@@ -0,0 +1,86 @@
+"""Shared fixtures for model tests."""
+
+import importlib
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import Mock, create_autospec, sentinel
+
+import pytest
+
+from taskra.api.models.user import User
+from taskra.api.services.users import UserService
+from taskra.api.services.worklogs import WorklogService
+
+# Service class name -> per-test fixture providing its autospec'd mock
+_SERVICE_MOCK_FIXTURES = {
+    "UserService": "user_service_mock",
+    "WorklogService": "worklog_service_mock",
+}
+
+
+@pytest.fixture(scope="module")
+def default_author():
+    """A validated User reused as the author across a test module."""
+    return User(
+        self_url="https://example.com/rest/api/3/user?accountId=123",
+        accountId="123",
+        displayName="Test User"
+    )
+
+
+@pytest.fixture(scope="module")
+def adf_body():
+    """A read-only single-paragraph Atlassian Document Format body."""
+    return MappingProxyType({
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {
+                "type": "paragraph",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": "This is a comment with formatting"
+                    }
+                ]
+            }
+        ]
+    })
+
+
+@pytest.fixture
+def user_service_mock():
+    """A fresh autospec'd UserService mock for this test."""
+    # Built per test: reset_mock() keeps attributes a test assigns, so a
+    # shared template would leak one test's configuration into the next
+    return create_autospec(UserService, instance=True)
+
+
+@pytest.fixture
+def worklog_service_mock():
+    """A fresh autospec'd WorklogService mock for this test."""
+    return create_autospec(WorklogService, instance=True)
+
+
+@pytest.fixture
+def core_service_mocks(monkeypatch, request):
+    """Wire a mock client and service into a taskra.core module.
+
+    Parametrize indirectly with ``(module, service_class_name)``, e.g.
+    ``("users", "UserService")``. ``get_client`` and the service class are
+    replaced with mocks returning ``client`` and ``service`` respectively;
+    ``client`` is an opaque sentinel and ``service`` is the autospec'd
+    service mock for that class.
+    """
+    mod, svc_name = request.param
+    client = sentinel.client
+    service = request.getfixturevalue(_SERVICE_MOCK_FIXTURES[svc_name])
+    mocks = SimpleNamespace(
+        client=client,
+        service=service,
+        get_client=Mock(return_value=client),
+        service_class=Mock(return_value=service),
+    )
+    module = importlib.import_module(f"taskra.core.{mod}")
+    monkeypatch.setattr(module, "get_client", mocks.get_client)
+    monkeypatch.setattr(module, svc_name, mocks.service_class)
+    return mocks
@@ -8,23 +8,34 @@ from taskra.api.models.base import (
     BaseJiraModel, BaseJiraListModel, ApiResource, TimestampedResource, to_camel
 )
 
+
+# Test models are defined once so pydantic builds their validators only once
+class _SnakeCaseModel(BaseJiraModel):
+    snake_case_field: str
+    another_field: int
+
+
+class _TestModel(BaseJiraModel):
+    required_field: str
+    optional_field: int = 0
+
+
 class TestBaseModels:
     """Tests for base model functionality."""
     
-    def test_to_camel(self):
+    @pytest.mark.parametrize("snake,camel", [
+        ("snake_case", "snakeCase"),
+        ("multiple_word_snake_case", "multipleWordSnakeCase"),
+        ("single", "single"),
+        ("", ""),
+    ])
+    def test_to_camel(self, snake, camel):
         """Test snake_case to camelCase conversion."""
-        assert to_camel("snake_case") == "snakeCase"
-        assert to_camel("multiple_word_snake_case") == "multipleWordSnakeCase"
-        assert to_camel("single") == "single"
-        assert to_camel("") == ""
+        assert to_camel(snake) == camel
     
     def test_base_jira_model_serialization(self):
         """Test BaseJiraModel serialization with aliases."""
-        class TestModel(BaseJiraModel):
-            snake_case_field: str
-            another_field: int
-        
-        model = TestModel(snakeCaseField="test", anotherField=123)
+        model = _SnakeCaseModel(snakeCaseField="test", anotherField=123)
         
         # Test property access uses snake_case
         assert model.snake_case_field == "test"
@@ -37,39 +48,26 @@ class TestBaseModels:
         assert data["snakeCaseField"] == "test"
         assert data["anotherField"] == 123
     
-    def test_base_jira_model_deserialization(self):
+    @pytest.mark.parametrize("data,expected", [
+        ({"snake_case_field": "test1", "another_field": 123}, "test1"),
+        ({"snakeCaseField": "test2", "anotherField": 456}, "test2"),
+    ], ids=["snake_case", "camelCase"])
+    def test_base_jira_model_deserialization(self, data, expected):
         """Test BaseJiraModel deserialization with either case."""
-        class TestModel(BaseJiraModel):
-            snake_case_field: str
-            another_field: int
-        
-        # Test loading with snake_case
-        model1 = TestModel(snake_case_field="test1", another_field=123)
-        assert model1.snake_case_field == "test1"
-        
-        # Test loading with camelCase
-        model2 = TestModel(snakeCaseField="test2", anotherField=456)
-        assert model2.snake_case_field == "test2"
+        model = _SnakeCaseModel(**data)
+        assert model.snake_case_field == expected
     
-    def test_from_api(self):
+    @pytest.mark.parametrize("data,req,opt", [
+        ({"requiredField": "value", "optionalField": 123}, "value", 123),
+        # Invalid data still creates a model, falling back to defaults
+        # (empty string for str fields, the declared default otherwise)
+        ({"optionalField": "not an int"}, "", 0),
+    ], ids=["valid", "invalid"])
+    def test_from_api(self, data, req, opt):
         """Test from_api classmethod with validation errors."""
-        class TestModel(BaseJiraModel):
-            required_field: str
-            optional_field: int = 0
-        
-        # Test with valid data
-        valid_data = {"requiredField": "value", "optionalField": 123}
-        model = TestModel.from_api(valid_data)
-        assert model.required_field == "value"
-        assert model.optional_field == 123
-        
-        # Test with invalid data - should still create model with partial data
-        invalid_data = {"optionalField": "not an int"}
-        model = TestModel.from_api(invalid_data)
-        
-        # The model should be created with default values since the data was invalid
-        assert model.optional_field == 0  # Default value should be used
-        assert model.required_field == ""  # Empty string is the default for str fields
+        model = _TestModel.from_api(data)
+        assert model.required_field == req
+        assert model.optional_field == opt
 
 
 class TestApiResource:
@@ -2,32 +2,26 @@
 
 import pytest
 from datetime import datetime
-from unittest.mock import Mock, patch
 
 from taskra.api.models.comment import Comment, CommentVisibility, CommentCreate
-from taskra.api.models.user import User
 from taskra.utils.model_adapters import adapt_comment_for_presentation
 
+# Timestamps are irrelevant to these assertions; keep them fixed and deterministic
+FIXED_DT = datetime(2024, 1, 1, 12, 0, 0)
+
 class TestCommentModels:
     """Test Comment models."""
     
-    def test_comment_serialization(self):
+    def test_comment_serialization(self, default_author):
         """Test serializing Comment models."""
-        # Create author
-        author = User(
-            self_url="https://example.com/rest/api/3/user?accountId=123",
-            accountId="123",
-            displayName="Test User"
-        )
-        
         # Create a simple text comment
         comment = Comment(
             self_url="https://example.com/rest/api/3/issue/TEST-1/comment/10000",
             id="10000",
-            author=author,
+            author=default_author,
             body="This is a comment",
-            created=datetime.now(),
-            updated=datetime.now()
+            created=FIXED_DT,
+            updated=FIXED_DT
         )
         
         # Serialize to dictionary
@@ -35,46 +29,18 @@ class TestCommentModels:
         
         # Verify serialization
         assert isinstance(result, dict)
-        assert "id" in result
-        assert result["id"] == "10000"
-        assert "body" in result
-        assert result["body"] == "This is a comment"
-        assert "author" in result
-        assert "displayName" in result["author"]
+        assert (result.get("id"), result.get("body")) == ("10000", "This is a comment")
+        assert "displayName" in result.get("author", {})
     
-    def test_comment_with_adf_body(self):
+    def test_comment_with_adf_body(self, default_author, adf_body):
         """Test Comment with Atlassian Document Format body."""
-        # Create author
-        author = User(
-            self_url="https://example.com/rest/api/3/user?accountId=123",
-            accountId="123",
-            displayName="Test User"
-        )
-        
-        # Create a comment with ADF body
-        adf_body = {
-            "type": "doc",
-            "version": 1,
-            "content": [
-                {
-                    "type": "paragraph",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": "This is a comment with formatting"
-                        }
-                    ]
-                }
-            ]
-        }
-        
         comment = Comment(
             self_url="https://example.com/rest/api/3/issue/TEST-1/comment/10000",
             id="10000",
-            author=author,
+            author=default_author,
             body=adf_body,
-            created=datetime.now(),
-            updated=datetime.now()
+            created=FIXED_DT,
+            updated=FIXED_DT
         )
         
         # Test text content extraction
@@ -99,39 +65,15 @@ class TestCommentModels:
         assert len(payload["body"]["content"]) > 0
         assert payload["body"]["content"][0]["content"][0]["text"] == "This is a new comment"
     
-    def test_comment_adapter(self):
+    def test_comment_adapter(self, default_author, adf_body):
         """Test comment adapter functions."""
-        # Create a comment with ADF body
-        adf_body = {
-            "type": "doc",
-            "version": 1,
-            "content": [
-                {
-                    "type": "paragraph",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": "This is a comment with formatting"
-                        }
-                    ]
-                }
-            ]
-        }
-        
-        # Create author
-        author = User(
-            self_url="https://example.com/rest/api/3/user?accountId=123",
-            accountId="123",
-            displayName="Test User"
-        )
-        
         comment = Comment(
             self_url="https://example.com/rest/api/3/issue/TEST-1/comment/10000",
             id="10000",
-            author=author,
+            author=default_author,
             body=adf_body,
-            created=datetime.now(),
-            updated=datetime.now()
+            created=FIXED_DT,
+            updated=FIXED_DT
         )
         
         # Adapt for presentation
@@ -1,8 +1,6 @@
 """Tests for User model integration with the core layer."""
 
 import pytest
-from unittest.mock import Mock, patch
-from datetime import datetime
 
 from taskra.api.models.user import User, CurrentUser
 from taskra.core.users import get_current_user, find_users
@@ -10,19 +8,14 @@ from taskra.core.users import get_current_user, find_users
 class TestCoreUserIntegration:
     """Test the integration between User models and core layer functions."""
     
-    @patch('taskra.core.users.UserService')
-    @patch('taskra.core.users.get_client')
-    def test_get_current_user_with_models(self, mock_get_client, mock_service_class):
+    @pytest.mark.parametrize("core_service_mocks", [("users", "UserService")], indirect=True)
+    def test_get_current_user_with_models(self, core_service_mocks):
         """Test get_current_user with model return values."""
-        # Setup
-        mock_client = Mock()
-        mock_get_client.return_value = mock_client
+        mocks = core_service_mocks
         
-        mock_service = Mock()
-        mock_service_class.return_value = mock_service
-        
-        # Create a model instance that the service will return
-        user_model = CurrentUser(
+        # Create a model instance that the service will return. The data is
+        # never round-tripped through the API, so skip validation.
+        user_model = CurrentUser.model_construct(
             self_url="https://example.com/rest/api/3/user?accountId=user123",
             accountId="user123",
             displayName="Test User",
@@ -30,36 +23,29 @@ class TestCoreUserIntegration:
             active=True,
             timeZone="UTC"
         )
-        mock_service.get_current_user.return_value = user_model
+        mocks.service.get_current_user.return_value = user_model
         
         # Execute
         result = get_current_user(refresh_cache=True)
         
         # Verify
-        mock_get_client.assert_called_once()
-        mock_service_class.assert_called_once_with(mock_client)
-        mock_service.get_current_user.assert_called_once()
+        mocks.get_client.assert_called_once()
+        mocks.service_class.assert_called_once_with(mocks.client)
+        mocks.service.get_current_user.assert_called_once()
         
         # The result should be a dictionary with the correct values
         assert isinstance(result, dict)
-        assert result["accountId"] == "user123"
-        assert result["displayName"] == "Test User"
+        assert (result.get("accountId"), result.get("displayName")) == ("user123", "Test User")
         assert "self" in result  # Ensure API URL is preserved
         
-    @patch('taskra.core.users.UserService')
-    @patch('taskra.core.users.get_client')
-    def test_find_users_with_models(self, mock_get_client, mock_service_class):
+    @pytest.mark.parametrize("core_service_mocks", [("users", "UserService")], indirect=True)
+    def test_find_users_with_models(self, core_service_mocks):
         """Test find_users with model return values."""
-        # Setup
-        mock_client = Mock()
-        mock_get_client.return_value = mock_client
-        
-        mock_service = Mock()
-        mock_service_class.return_value = mock_service
+        mocks = core_service_mocks
         
         # Create a list of model instances that the service will return
         user_models = [
-            User(
+            User.model_construct(
                 self_url=f"https://example.com/rest/api/3/user?accountId=user{i}",
                 accountId=f"user{i}",
                 displayName=f"Test User {i}",
@@ -69,15 +55,15 @@ class TestCoreUserIntegration:
             )
             for i in range(3)
         ]
-        mock_service.find_users.return_value = user_models
+        mocks.service.find_users.return_value = user_models
         
         # Execute
         result = find_users("test", refresh_cache=True)
         
         # Verify
-        mock_get_client.assert_called_once()
-        mock_service_class.assert_called_once_with(mock_client)
-        mock_service.find_users.assert_called_once()
+        mocks.get_client.assert_called_once()
+        mocks.service_class.assert_called_once_with(mocks.client)
+        mocks.service.find_users.assert_called_once()
         
         # The result should be a list of dictionaries with the correct values
         assert isinstance(result, list)
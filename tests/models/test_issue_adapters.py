@@ -2,7 +2,6 @@
 
 import pytest
 from datetime import datetime
-from unittest.mock import Mock, patch
 
 from taskra.api.models.issue import Issue, IssueFields, IssueType, IssueStatus
 from taskra.utils.model_adapters import adapt_issue_for_presentation
@@ -2,7 +2,6 @@
 
 import pytest
 from datetime import datetime
-from unittest.mock import Mock, patch
 
 from taskra.api.models.user import User
 from taskra.utils.model_adapters import adapt_user_for_presentation
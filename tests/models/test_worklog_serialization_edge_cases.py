@@ -2,10 +2,12 @@
 
 import pytest
 from datetime import datetime, timezone
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import patch, sentinel
 
-from taskra.api.models.worklog import Worklog, Author, WorklogCreate
+from taskra.api.models.worklog import Worklog, Author, WorklogCreate, WorklogList
 from taskra.api.models.user import User
+from taskra.core import worklogs as _wl
 from taskra.core.worklogs import _to_json_serializable, add_worklog
 
 class TestWorklogSerializationEdgeCases:
@@ -14,7 +16,7 @@ class TestWorklogSerializationEdgeCases:
     def test_complex_nested_objects(self):
         """Test serializing complex nested objects in a worklog."""
         # Create a complex nested structure
-        author = Author(
+        author = Author.model_construct(
             accountId="user123",
             displayName="Test User",
             emailAddress="test@example.com",
@@ -25,7 +27,7 @@ class TestWorklogSerializationEdgeCases:
         )
         
         # Create a worklog with complex comment structure
-        worklog = Worklog(
+        worklog = Worklog.model_construct(
             id="12345",
             self="https://example.com/rest/api/3/issue/TEST-123/worklog/12345",
             author=author,
@@ -76,10 +78,10 @@ class TestWorklogSerializationEdgeCases:
         dt_with_tz = datetime.now(timezone.utc)
         
         # Create a worklog with timezone-aware datetime
-        worklog = Worklog(
+        worklog = Worklog.model_construct(
             id="12345",
             self="https://example.com/api",
-            author=Author(accountId="123", displayName="User"),
+            author=Author.model_construct(accountId="123", displayName="User"),
             timeSpent="1h",
             timeSpentSeconds=3600,
             started=dt_with_tz,
@@ -93,15 +95,16 @@ class TestWorklogSerializationEdgeCases:
         # Check datetime fields are properly serialized to ISO format
         assert isinstance(result["started"], str)
         assert "T" in result["started"]
-        assert "+" in result["started"] or "Z" in result["started"]  # Timezone marker
+        # pydantic-core emits "Z" for UTC and "+HH:MM" for other offsets
+        assert result["started"].endswith(("Z", "+00:00"))
         
     def test_empty_fields(self):
         """Test handling of empty or None fields."""
         # Create a worklog with minimal fields
-        worklog = Worklog(
+        worklog = Worklog.model_construct(
             id="12345",
             self="https://example.com/api",
-            author=Author(accountId="123", displayName="User"),
+            author=Author.model_construct(accountId="123", displayName="User"),
             timeSpent="1h",
             timeSpentSeconds=3600,
             started=datetime.now(),
@@ -120,16 +123,35 @@ class TestWorklogSerializationEdgeCases:
         assert "comment" in result
         assert result["comment"] is None
         
-    @patch('taskra.core.worklogs.WorklogService')
-    @patch('taskra.core.worklogs.get_client')
+    def test_nested_worklogs_keep_issue_fields(self):
+        """Test that worklogs inside a container model still get the issue key/summary variants."""
+        started = datetime(2023, 1, 1, 9, 0, tzinfo=timezone.utc)
+        worklog = Worklog.model_validate({
+            "self": "https://example.com/rest/api/3/issue/TEST-123/worklog/12345",
+            "id": "12345",
+            "author": {"accountId": "user123", "displayName": "Test User"},
+            "timeSpent": "1h",
+            "timeSpentSeconds": 3600,
+            "started": started,
+            "created": started,
+            "updated": started,
+        })
+        worklog.issue_key = "TEST-123"
+        worklog.issue_summary = "Test issue"
+        worklog_list = WorklogList(startAt=0, maxResults=50, total=1, worklogs=[worklog])
+        
+        result = _to_json_serializable(worklog_list)
+        
+        nested = result["worklogs"][0]
+        assert nested["issueKey"] == nested["issue_key"] == "TEST-123"
+        assert nested["issueSummary"] == nested["issue_summary"] == "Test issue"
+        
+    @patch.object(_wl, 'WorklogService')
+    @patch.object(_wl, 'get_client')
     def test_add_worklog_with_complex_comment(self, mock_get_client, mock_service_class):
         """Test adding a worklog with a complex comment structure."""
         # Setup
-        mock_client = Mock()
-        mock_get_client.return_value = mock_client
-        
-        mock_service = Mock()
-        mock_service_class.return_value = mock_service
+        mock_get_client.return_value = sentinel.client
         
         # Create a complex comment structure that the service will return
         complex_comment = {
@@ -149,8 +171,8 @@ class TestWorklogSerializationEdgeCases:
         }
         
         # Create model to return
-        author = Author(accountId="user123", displayName="Test User")
-        worklog_model = Worklog(
+        author = Author.model_construct(accountId="user123", displayName="Test User")
+        worklog_model = Worklog.model_construct(
             id="12345",
             self="https://example.com/rest/api/3/issue/TEST-123/worklog/12345",
             author=author,
@@ -161,7 +183,10 @@ class TestWorklogSerializationEdgeCases:
             updated=datetime.now(),
             comment=complex_comment
         )
-        mock_service.add_worklog.return_value = worklog_model
+        # Stub service; only its return value matters here
+        mock_service_class.return_value = SimpleNamespace(
+            add_worklog=lambda *args, **kwargs: worklog_model
+        )
         
         # Execute
         result = add_worklog("TEST-123", "1h 30m", "Test comment")
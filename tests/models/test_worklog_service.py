@@ -1,16 +1,18 @@
 """Tests for the WorklogService using Pydantic models."""
 
+import json
 import pytest
 from unittest.mock import Mock, patch
 from datetime import datetime
 
+from taskra.api.services import worklogs as _worklogs
 from taskra.api.services.worklogs import WorklogService
 from taskra.api.models.worklog import Worklog, WorklogCreate, WorklogList
 
 
-@pytest.fixture
-def mock_client():
-    """Mock the Jira client."""
+@pytest.fixture(scope="module")
+def _mock_client():
+    """Mock Jira client with canned responses, built once per module."""
     client = Mock()
     
     # Mock responses
@@ -54,6 +56,16 @@ def mock_client():
     return client
 
 
+@pytest.fixture
+def mock_client(_mock_client):
+    """The module's mock client with call history cleared for this test.
+
+    Tests that change a response should do so via monkeypatch so it is restored.
+    """
+    _mock_client.reset_mock()
+    return _mock_client
+
+
 class TestWorklogService:
     """Tests for the WorklogService."""
     
@@ -70,8 +82,13 @@ class TestWorklogService:
         args, kwargs = mock_client.post.call_args
         assert "issue/TEST-123/worklog" in args[0]
         
-        # Instead of checking for kwargs["json"], let's create the expected payload
-        # in the mock setup to match how the actual implementation works
+        # The body is pre-encoded JSON sent as bytes
+        body = kwargs["data"]
+        assert type(body) is bytes
+        payload = json.loads(body)
+        assert payload["timeSpent"] == "1h"
+        assert "started" in payload
+        assert "comment" in payload
         
         # Verify result
         assert isinstance(result, Worklog)
@@ -79,6 +96,17 @@ class TestWorklogService:
         assert result.time_spent == "1h"
         assert result.time_spent_seconds == 3600
     
+    def test_add_worklog_non_ascii_comment(self, mock_client):
+        """Test a comment outside latin-1 is sent as UTF-8 encoded bytes."""
+        service = WorklogService(mock_client)
+        comment = "Réunion – 会议 ✓"
+        
+        service.add_worklog("TEST-123", "1h", comment)
+        
+        body = mock_client.post.call_args.kwargs["data"]
+        assert type(body) is bytes
+        assert comment.encode("utf-8") in body
+    
     def test_list_worklogs(self, mock_client):
         """Test listing worklogs."""
         # Create the service with mock client
@@ -99,18 +127,18 @@ class TestWorklogService:
         assert results[0].id == "12345"
         assert results[0].time_spent == "1h"
     
-    @patch("taskra.api.services.worklogs.logging")
-    def test_get_user_worklogs(self, mock_logging, mock_client):
+    @patch.object(_worklogs, "logging")
+    def test_get_user_worklogs(self, mock_logging, mock_client, monkeypatch):
         """Test getting user worklogs."""
         # Mock search response
-        mock_client.get.return_value = {
+        monkeypatch.setattr(mock_client.get, "return_value", {
             "issues": [
                 {
                     "key": "TEST-123",
                     "fields": {"summary": "Test Issue"}
                 }
             ]
-        }
+        })
         
         # Create the service with mock client
         service = WorklogService(mock_client)
@@ -129,7 +157,7 @@ class TestWorklogService:
         mock_logging.reset_mock()
         
         # Test with error
-        mock_client.get.side_effect = Exception("API error")
+        monkeypatch.setattr(mock_client.get, "side_effect", Exception("API error"))
         
         # Should handle error gracefully
         results = service.get_user_worklogs()
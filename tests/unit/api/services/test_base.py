@@ -0,0 +1,40 @@
+"""Tests for the BaseService pagination helper."""
+
+import time
+from unittest.mock import Mock
+
+from taskra.api.services.base import BaseService, MAX_PAGE_WORKERS
+
+
+class _Service(BaseService):
+    """Concrete BaseService for exercising the shared helpers."""
+
+
+class TestGetPages:
+    """Tests for BaseService._get_pages."""
+    
+    def test_no_offsets_makes_no_requests(self):
+        """Test that an empty offset list returns without calling the client."""
+        mock_client = Mock()
+        service = _Service(mock_client)
+        
+        assert service._get_pages("project/search", range(0), 50) == []
+        mock_client.get.assert_not_called()
+    
+    def test_pages_keep_offset_order(self):
+        """Test that pages come back in offset order when more pages than workers are fetched."""
+        offsets = list(range(0, 3 * MAX_PAGE_WORKERS))
+        
+        def get(endpoint, params):
+            # Earlier pages answer last, so completion order is the reverse of request order
+            time.sleep((len(offsets) - params["startAt"]) * 0.002)
+            return {"startAt": params["startAt"]}
+        
+        mock_client = Mock()
+        mock_client.get.side_effect = get
+        service = _Service(mock_client)
+        
+        pages = service._get_pages("project/search", offsets, 1)
+        
+        assert [page["startAt"] for page in pages] == offsets
+        assert mock_client.get.call_count == len(offsets)
@@ -0,0 +1,64 @@
+"""Tests for the CommentsService class."""
+
+from unittest.mock import Mock
+
+from taskra.api.services.comments import CommentsService
+
+# Author shared by every generated comment
+_AUTHOR = {
+    "self": "https://example.atlassian.net/rest/api/3/user?accountId=user123",
+    "accountId": "user123",
+    "displayName": "John Doe",
+}
+
+
+def _comment_page(start_at, count, total, max_results=2):
+    """Build a comment page response holding comments start_at..start_at+count-1."""
+    return {
+        "comments": [
+            {
+                "self": f"https://example.atlassian.net/rest/api/3/issue/TEST-1/comment/{10000 + i}",
+                "id": str(10000 + i),
+                "author": _AUTHOR,
+                "body": f"Comment {i}",
+                "created": "2023-01-01T10:00:00.000+0000",
+                "updated": "2023-01-01T10:00:00.000+0000",
+            }
+            for i in range(start_at, start_at + count)
+        ],
+        "startAt": start_at,
+        "maxResults": max_results,
+        "total": total,
+    }
+
+
+class TestCommentsService:
+    """Tests for the CommentsService class."""
+    
+    def test_list_all_comments_pagination(self):
+        """Test listing all comments when the server caps pages below maxResults."""
+        mock_client = Mock()
+        # The service asks for 50 per page but the server only ever returns 2.
+        # Later pages are fetched concurrently, so answer by startAt rather than call order
+        mock_client.get.side_effect = lambda endpoint, params: _comment_page(
+            params["startAt"], min(2, 5 - params["startAt"]), 5
+        )
+        service = CommentsService(mock_client)
+        
+        comments = service.list_comments("TEST-1", get_all=True)
+        
+        assert [comment.id for comment in comments] == [str(10000 + i) for i in range(5)]
+        assert mock_client.get.call_count == 3
+        for start_at in (2, 4):
+            mock_client.get.assert_any_call(
+                "issue/TEST-1/comment", params={"startAt": start_at, "maxResults": 50}
+            )
+    
+    def test_list_all_comments_empty(self):
+        """Test that an empty first page ends pagination."""
+        mock_client = Mock()
+        mock_client.get.return_value = _comment_page(0, 0, 0)
+        service = CommentsService(mock_client)
+        
+        assert service.list_comments("TEST-1", get_all=True) == []
+        mock_client.get.assert_called_once()
@@ -1,19 +1,78 @@
 """Tests for the IssuesService class."""
 
+import copy
 import pytest
-from unittest.mock import Mock, patch
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import Mock
 
 from taskra.api.services.issues import IssuesService
 
 
+# Comment pages served by the pagination tests, keyed by startAt.
+# Only the outer mapping is read-only; tests get a deep copy via _comment_page.
+_COMMENT_PAGES = MappingProxyType({page["startAt"]: page for page in (
+    # First page
+    {
+        "comments": [
+            {
+                "id": "10000",
+                "body": "First comment",
+                "author": {"displayName": "User 1"}
+            },
+            {
+                "id": "10001",
+                "body": "Second comment",
+                "author": {"displayName": "User 2"}
+            }
+        ],
+        "startAt": 0,
+        "maxResults": 2,
+        "total": 5
+    },
+    # Second page
+    {
+        "comments": [
+            {
+                "id": "10002",
+                "body": "Third comment",
+                "author": {"displayName": "User 3"}
+            },
+            {
+                "id": "10003",
+                "body": "Fourth comment",
+                "author": {"displayName": "User 1"}
+            }
+        ],
+        "startAt": 2,
+        "maxResults": 2,
+        "total": 5
+    },
+    # Third page
+    {
+        "comments": [
+            {
+                "id": "10004",
+                "body": "Fifth comment",
+                "author": {"displayName": "User 2"}
+            }
+        ],
+        "startAt": 4,
+        "maxResults": 2,
+        "total": 5
+    }
+)})
+
+
+def _comment_page(start_at):
+    """Return a private copy of the comment page starting at start_at."""
+    return copy.deepcopy(_COMMENT_PAGES[start_at])
+
+
 class TestIssuesService:
     """Tests for the IssuesService class."""
     
     def test_get_issue(self):
         """Test retrieving a single issue."""
-        # Create a mock client
-        mock_client = Mock()
-        
         # Set up the mock to return a sample response that matches the Issue model structure
         mock_response = {
             "id": "10000",
@@ -42,7 +101,8 @@ class TestIssuesService:
                 }
             }
         }
-        mock_client.get.return_value = mock_response
+        # Stub client; nothing asserts on its calls, so no Mock is needed
+        mock_client = SimpleNamespace(get=lambda *args, **kwargs: mock_response)
         
         # Create the service with the mock client
         service = IssuesService(mock_client)
@@ -108,60 +168,8 @@ class TestIssuesService:
         # Create a mock client
         mock_client = Mock()
         
-        # Set up the mock to return multiple pages of results
-        mock_responses = [
-            # First page
-            {
-                "comments": [
-                    {
-                        "id": "10000",
-                        "body": "First comment",
-                        "author": {"displayName": "User 1"}
-                    },
-                    {
-                        "id": "10001",
-                        "body": "Second comment",
-                        "author": {"displayName": "User 2"}
-                    }
-                ],
-                "startAt": 0,
-                "maxResults": 2,
-                "total": 5
-            },
-            # Second page
-            {
-                "comments": [
-                    {
-                        "id": "10002",
-                        "body": "Third comment",
-                        "author": {"displayName": "User 3"}
-                    },
-                    {
-                        "id": "10003",
-                        "body": "Fourth comment",
-                        "author": {"displayName": "User 1"}
-                    }
-                ],
-                "startAt": 2,
-                "maxResults": 2,
-                "total": 5
-            },
-            # Third page
-            {
-                "comments": [
-                    {
-                        "id": "10004",
-                        "body": "Fifth comment",
-                        "author": {"displayName": "User 2"}
-                    }
-                ],
-                "startAt": 4,
-                "maxResults": 2,
-                "total": 5
-            }
-        ]
-        
-        mock_client.get.side_effect = mock_responses
+        # Later pages are fetched concurrently, so answer by startAt rather than call order
+        mock_client.get.side_effect = lambda endpoint, params: _comment_page(params["startAt"])
         
         # Create the service with the mock client
         service = IssuesService(mock_client)
@@ -185,3 +193,43 @@ class TestIssuesService:
         mock_client.get.assert_any_call(
             "issue/TEST-1/comment", params={"startAt": 4, "maxResults": 2}
         )
+    
+    def test_get_all_comments_empty_first_page(self):
+        """Test that an empty first page stops pagination even if total says otherwise."""
+        mock_client = Mock()
+        mock_client.get.return_value = {"comments": [], "startAt": 0, "maxResults": 50, "total": 3}
+        
+        service = IssuesService(mock_client)
+        
+        assert service.get_comments("TEST-1") == []
+        mock_client.get.assert_called_once()
+    
+    def test_get_all_comments_single_page_makes_one_request(self):
+        """Test that no further pages are requested when the total fits in the first page."""
+        mock_client = Mock()
+        mock_client.get.return_value = _comment_page(0) | {"total": 2}
+        
+        service = IssuesService(mock_client)
+        
+        comments = service.get_comments("TEST-1", max_results=2)
+        
+        assert [comment["id"] for comment in comments] == ["10000", "10001"]
+        mock_client.get.assert_called_once_with(
+            "issue/TEST-1/comment", params={"startAt": 0, "maxResults": 2}
+        )
+    
+    def test_get_all_comments_server_capped_page_size(self):
+        """Test stepping by the returned page size when the server caps maxResults."""
+        mock_client = Mock()
+        # Pages hold 2 comments although 50 are requested
+        mock_client.get.side_effect = lambda endpoint, params: _comment_page(params["startAt"])
+        
+        service = IssuesService(mock_client)
+        
+        comments = service.get_comments("TEST-1", max_results=50)
+        
+        assert [comment["id"] for comment in comments] == [f"1000{i}" for i in range(5)]
+        assert mock_client.get.call_count == 3
+        mock_client.get.assert_any_call(
+            "issue/TEST-1/comment", params={"startAt": 4, "maxResults": 50}
+        )
@@ -1,12 +1,87 @@
 """Tests for the ProjectsService class."""
 
+import copy
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from types import MappingProxyType
+from unittest.mock import Mock
 
 from taskra.api.services.projects import ProjectsService
 from taskra.api.models.project import ProjectList
 
 
+# Project pages served by the pagination test, keyed by startAt.
+# Only the outer mapping is read-only; tests get a deep copy via _project_page.
+_PROJECT_PAGES = MappingProxyType({page["startAt"]: page for page in (
+    # First page
+    {
+        "startAt": 0,
+        "maxResults": 2,
+        "total": 5,
+        "isLast": False,
+        "values": [
+            {
+                "id": "10000", 
+                "key": "TEST1", 
+                "name": "Test Project 1", 
+                "projectTypeKey": "software",
+                "self": "https://example.com/rest/api/3/project/10000"  # Add required field
+            },
+            {
+                "id": "10001", 
+                "key": "TEST2", 
+                "name": "Test Project 2", 
+                "projectTypeKey": "software",
+                "self": "https://example.com/rest/api/3/project/10001"  # Add required field
+            }
+        ]
+    },
+    # Second page
+    {
+        "startAt": 2,
+        "maxResults": 2,
+        "total": 5,
+        "isLast": False,
+        "values": [
+            {
+                "id": "10002", 
+                "key": "TEST3", 
+                "name": "Test Project 3", 
+                "projectTypeKey": "software",
+                "self": "https://example.com/rest/api/3/project/10002"  # Add required field
+            },
+            {
+                "id": "10003", 
+                "key": "TEST4", 
+                "name": "Test Project 4", 
+                "projectTypeKey": "software",
+                "self": "https://example.com/rest/api/3/project/10003"  # Add required field
+            }
+        ]
+    },
+    # Third page
+    {
+        "startAt": 4,
+        "maxResults": 2,
+        "total": 5,
+        "isLast": True,
+        "values": [
+            {
+                "id": "10004", 
+                "key": "TEST5", 
+                "name": "Test Project 5", 
+                "projectTypeKey": "software",
+                "self": "https://example.com/rest/api/3/project/10004"  # Add required field
+            }
+        ]
+    }
+)})
+
+
+def _project_page(start_at):
+    """Return a private copy of the project page starting at start_at."""
+    return copy.deepcopy(_PROJECT_PAGES[start_at])
+
+
 class TestProjectsService:
     """Tests for the ProjectsService class."""
     
@@ -61,73 +136,8 @@ class TestProjectsService:
         # Create a mock client
         mock_client = Mock()
         
-        # Set up the mock to return multiple pages of results with required fields
-        mock_responses = [
-            # First page
-            {
-                "startAt": 0,
-                "maxResults": 2,
-                "total": 5,
-                "isLast": False,
-                "values": [
-                    {
-                        "id": "10000", 
-                        "key": "TEST1", 
-                        "name": "Test Project 1", 
-                        "projectTypeKey": "software",
-                        "self": "https://example.com/rest/api/3/project/10000"  # Add required field
-                    },
-                    {
-                        "id": "10001", 
-                        "key": "TEST2", 
-                        "name": "Test Project 2", 
-                        "projectTypeKey": "software",
-                        "self": "https://example.com/rest/api/3/project/10001"  # Add required field
-                    }
-                ]
-            },
-            # Second page
-            {
-                "startAt": 2,
-                "maxResults": 2,
-                "total": 5,
-                "isLast": False,
-                "values": [
-                    {
-                        "id": "10002", 
-                        "key": "TEST3", 
-                        "name": "Test Project 3", 
-                        "projectTypeKey": "software",
-                        "self": "https://example.com/rest/api/3/project/10002"  # Add required field
-                    },
-                    {
-                        "id": "10003", 
-                        "key": "TEST4", 
-                        "name": "Test Project 4", 
-                        "projectTypeKey": "software",
-                        "self": "https://example.com/rest/api/3/project/10003"  # Add required field
-                    }
-                ]
-            },
-            # Third page
-            {
-                "startAt": 4,
-                "maxResults": 2,
-                "total": 5,
-                "isLast": True,
-                "values": [
-                    {
-                        "id": "10004", 
-                        "key": "TEST5", 
-                        "name": "Test Project 5", 
-                        "projectTypeKey": "software",
-                        "self": "https://example.com/rest/api/3/project/10004"  # Add required field
-                    }
-                ]
-            }
-        ]
-        
-        mock_client.get.side_effect = mock_responses
+        # Later pages are fetched concurrently, so answer by startAt rather than call order
+        mock_client.get.side_effect = lambda endpoint, params: _project_page(params["startAt"])
         
         # Create the service with the mock client
         service = ProjectsService(mock_client)
@@ -1,72 +1,93 @@
 """Tests for the JiraClient class and client factory functions."""
 
-import os
 import pytest
-from unittest.mock import patch, MagicMock, Mock
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import patch
 
-from taskra.api.client import JiraClient, get_client, get_jira_client
-from taskra.api.auth import get_auth_details
+import taskra.api.client as _client
+from taskra.api.client import JiraClient, get_client, reset_client
 from requests.auth import HTTPBasicAuth
 
+# Credentials the stubbed get_auth_details hands to get_client
+_AUTH_DETAILS = MappingProxyType({
+    "base_url": "https://env-test.atlassian.net",
+    "email": "env-user@example.com",
+    "token": "env-token",
+})
+
+
+@pytest.fixture(scope="class", params=[
+    "https://example.atlassian.net",
+    "https://example.atlassian.net/",
+    "https://example.atlassian.net/rest/api/3/",
+], ids=["bare", "trailing_slash", "api_path"])
+def sample_client(request):
+    """A JiraClient per base URL form, shared by the read-only tests of a class.
+
+    JiraClient.__init__ only sets attributes and builds an unused session, so
+    one instance can safely serve every test that merely inspects it.
+    """
+    return JiraClient(
+        base_url=request.param,
+        email="test@example.com",
+        api_token="api-token"
+    )
+
+
+@pytest.fixture
+def fresh_client():
+    """Clear the cached client before and after the test."""
+    reset_client()
+    yield
+    reset_client()
+
 
 class TestJiraClient:
     """Tests for the JiraClient class."""
     
-    def test_client_initialization(self):
+    def test_client_initialization(self, sample_client):
         """Test that client is properly initialized."""
-        client = JiraClient(
-            base_url="https://example.atlassian.net",
-            email="test@example.com",
-            api_token="api-token"
-        )
+        client = sample_client
         
         assert client.base_url == "https://example.atlassian.net/rest/api/3/"
         assert isinstance(client.auth, HTTPBasicAuth)
+        assert (client.auth.username, client.auth.password) == ("test@example.com", "api-token")
     
-    def test_get_client_with_env_vars(self, monkeypatch):
-        """Test get_client with environment variables."""
-        # Set environment variables
-        monkeypatch.setenv("JIRA_BASE_URL", "https://env-test.atlassian.net")
-        monkeypatch.setenv("JIRA_EMAIL", "env-user@example.com")
-        monkeypatch.setenv("JIRA_API_TOKEN", "env-token")
+    def test_get_client_with_env_vars(self, fresh_client, monkeypatch):
+        """Test get_client with credentials resolved from the environment."""
+        # Stub the resolver with fixed values rather than round-tripping os.environ
+        monkeypatch.setattr(_client, "get_auth_details", lambda: dict(_AUTH_DETAILS))
         
-        # Create a mock JiraClient and mock the singleton directly
-        mock_client = Mock(spec=JiraClient)
-        mock_client.base_url = "https://env-test.atlassian.net/rest/api/3/"
-        mock_client.auth = Mock(spec=HTTPBasicAuth)
-        mock_client.auth.username = "env-user@example.com"
-        mock_client.auth.password = "env-token"
+        # Stand-in client; the test only reads these attributes
+        mock_client = SimpleNamespace(
+            base_url="https://env-test.atlassian.net/rest/api/3/",
+            auth=SimpleNamespace(username="env-user@example.com", password="env-token"),
+        )
         
-        # Patch JiraClient and also patch _jira_client to None to force recreation
-        with patch('taskra.api.client.JiraClient', return_value=mock_client) as mock_class:
-            # Reset client instance
-            with patch('taskra.api.client._jira_client', None):
-                client = get_client()
-                
-                # Verify the client was instantiated with the correct parameters
-                mock_class.assert_called_once()
+        # Patch JiraClient; the fixture cleared the singleton to force recreation
+        with patch.object(_client, 'JiraClient', return_value=mock_client) as mock_class:
+            client = get_client()
             
-        # Verify it uses environment variables
+            # Verify the client was instantiated with the correct parameters
+            mock_class.assert_called_once_with(
+                _AUTH_DETAILS["base_url"], _AUTH_DETAILS["email"], _AUTH_DETAILS["token"]
+            )
+            
+        # Verify it uses the resolved credentials
         assert client.base_url == "https://env-test.atlassian.net/rest/api/3/"
         assert client.auth.username == "env-user@example.com"
         assert client.auth.password == "env-token"
     
-    def test_get_client_with_config_fallback(self, monkeypatch):
+    def test_get_client_with_config_fallback(self):
         """Test get_client falls back to configuration when no env vars."""
-        # Clear environment variables
-        monkeypatch.delenv("JIRA_BASE_URL", raising=False)
-        monkeypatch.delenv("JIRA_EMAIL", raising=False)
-        monkeypatch.delenv("JIRA_API_TOKEN", raising=False)
-        
-        # Create a mock client to be returned directly
-        mock_client = Mock(spec=JiraClient)
-        mock_client.base_url = "https://config-test.atlassian.net/rest/api/3/"
-        mock_client.auth = Mock(spec=HTTPBasicAuth)
-        mock_client.auth.username = "config-user@example.com"
-        mock_client.auth.password = "config-token"
+        # Stand-in client to be returned directly; the test only reads these attributes
+        mock_client = SimpleNamespace(
+            base_url="https://config-test.atlassian.net/rest/api/3/",
+            auth=SimpleNamespace(username="config-user@example.com", password="config-token"),
+        )
         
         # Patch get_jira_client to return our mock
-        with patch('taskra.api.client.get_jira_client', return_value=mock_client):
+        with patch.object(_client, 'get_jira_client', return_value=mock_client):
             client = get_client()
             
             # Verify it uses our mock client
@@ -79,7 +100,7 @@ class TestJiraClient:
         """Test get_client raises error when no env vars and no config."""
         # Direct test using a completely patched environment
         # Patch get_jira_client to raise an error directly
-        with patch('taskra.api.client.get_jira_client') as mock_get_jira:
+        with patch.object(_client, 'get_jira_client') as mock_get_jira:
             mock_get_jira.side_effect = ValueError("No Jira account configured: Missing required authentication details")
             
             # Verify it raises an error
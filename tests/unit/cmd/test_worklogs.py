@@ -0,0 +1,47 @@
+"""Unit tests for the worklog command helpers."""
+
+import datetime
+
+from taskra.api.models.worklog import Worklog
+from taskra.cmd.commands.worklogs import _calculate_gaps, _parse_worklog_datetime
+from taskra.core.worklogs import _to_json_serializable
+
+
+def _serialized_worklog(wid, started):
+    """Serialize a one-hour worklog the way the core layer hands it to the commands."""
+    return _to_json_serializable(Worklog.model_validate({
+        "self": f"https://example.com/rest/api/3/issue/TEST-1/worklog/{wid}",
+        "id": wid,
+        "author": {"accountId": "user123", "displayName": "Test User"},
+        "timeSpent": "1h",
+        "timeSpentSeconds": 3600,
+        "started": started,
+        "created": started,
+        "updated": started,
+    }))
+
+
+class TestWorklogGaps:
+    """Tests for sorting worklogs and finding the gaps between them."""
+    
+    def test_mixed_offsets_sort_and_gaps(self):
+        """Test UTC ("Z") and offset worklogs sort together and yield wall-clock gaps."""
+        worklogs = [
+            _serialized_worklog("1", "2024-01-01T09:30:00.000+0000"),
+            _serialized_worklog("2", "2024-01-01T11:00:00.000+0200"),
+        ]
+        
+        worklogs = sorted(worklogs, key=_parse_worklog_datetime, reverse=True)
+        gaps = _calculate_gaps(worklogs)
+        
+        assert [worklog["id"] for worklog in worklogs] == ["2", "1"]
+        assert [(gap["start_time"].strftime("%H:%M"), gap["duration_seconds"]) for gap in gaps] == [
+            ("12:00", 16200), ("10:30", 1800), ("09:00", 1800)
+        ]
+    
+    def test_parse_drops_offset(self):
+        """Test every offset spelling parses to the same naive wall-clock time."""
+        expected = datetime.datetime(2024, 1, 1, 9, 30)
+        for started in ("2024-01-01T09:30:00Z", "2024-01-01T09:30:00+00:00",
+                        "2024-01-01T09:30:00.000+0000", "2024-01-01T09:30:00.123-05:00"):
+            assert _parse_worklog_datetime({"started": started}) == expected
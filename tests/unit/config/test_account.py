@@ -2,8 +2,8 @@
 
 import os
 import pytest
-from unittest.mock import patch, Mock, MagicMock
 
+import taskra.config.account as _account
 from taskra.config.account import (
     list_accounts,
     get_current_account,
@@ -19,22 +19,23 @@ from taskra.api.services.users import UserService  # Add proper import
 class TestAccountManagement:
     """Tests for the account management functionality."""
     
-    def test_get_subdomain_from_url(self):
+    @pytest.mark.parametrize("url,expected", [
+        # Regular Atlassian cloud URLs
+        ("https://mycompany.atlassian.net", "mycompany"),
+        ("http://test-team.atlassian.net", "test-team"),
+        # URL with path
+        ("https://mycompany.atlassian.net/jira", "mycompany"),
+        # Non-Atlassian URL
+        ("https://example.com", "example.com"),
+    ], ids=["https", "http", "with_path", "non_atlassian"])
+    def test_get_subdomain_from_url(self, url, expected):
         """Test extracting subdomain from Jira URL."""
-        # Test regular Atlassian cloud URL
-        assert get_subdomain_from_url("https://mycompany.atlassian.net") == "mycompany"
-        assert get_subdomain_from_url("http://test-team.atlassian.net") == "test-team"
-        
-        # Test URL with path
-        assert get_subdomain_from_url("https://mycompany.atlassian.net/jira") == "mycompany"
-        
-        # Test non-Atlassian URL
-        assert get_subdomain_from_url("https://example.com") == "example.com"
+        assert get_subdomain_from_url(url) == expected
     
     def test_list_accounts_empty(self, monkeypatch):
         """Test listing accounts when none exist."""
-        # Mock config_manager.read_config to return empty accounts
-        monkeypatch.setattr("taskra.config.account.config_manager.read_config", 
+        # Mock config_manager.read_config_view to return empty accounts
+        monkeypatch.setattr(_account.config_manager, "read_config_view", 
                         lambda: {"accounts": {}, "default_account": None})
         
         accounts = list_accounts()
@@ -50,7 +51,7 @@ class TestAccountManagement:
             },
             "default_account": "account1"
         }
-        monkeypatch.setattr("taskra.config.account.config_manager.read_config", lambda: mock_config)
+        monkeypatch.setattr(_account.config_manager, "read_config_view", lambda: mock_config)
         
         accounts = list_accounts()
         assert len(accounts) == 2
@@ -72,7 +73,7 @@ class TestAccountManagement:
             },
             "default_account": "account1"
         }
-        monkeypatch.setattr("taskra.config.account.config_manager.read_config", lambda: mock_config)
+        monkeypatch.setattr(_account.config_manager, "read_config_view", lambda: mock_config)
         monkeypatch.delenv("TASKRA_ACCOUNT", raising=False)  # Ensure env var is not set
         
         account = get_current_account()
@@ -89,7 +90,7 @@ class TestAccountManagement:
             },
             "default_account": "account1"
         }
-        monkeypatch.setattr("taskra.config.account.config_manager.read_config", lambda: mock_config)
+        monkeypatch.setattr(_account.config_manager, "read_config_view", lambda: mock_config)
         monkeypatch.setenv("TASKRA_ACCOUNT", "account2")
         
         account = get_current_account()
@@ -101,56 +102,48 @@ class TestAccountManagement:
             "accounts": {},
             "default_account": None
         }
-        monkeypatch.setattr("taskra.config.account.config_manager.read_config", lambda: mock_config)
+        monkeypatch.setattr(_account.config_manager, "read_config_view", lambda: mock_config)
         monkeypatch.delenv("TASKRA_ACCOUNT", raising=False)
         
         account = get_current_account()
         assert account is None
 
-    def test_add_first_account(self, monkeypatch):
+    def test_add_first_account(self, monkeypatch, config_update_recorder):
         """Test adding the first account (should become default)."""
         # Mock empty config
-        monkeypatch.setattr("taskra.config.account.config_manager.read_config", 
+        monkeypatch.setattr(_account.config_manager, "read_config", 
                         lambda: {"accounts": {}, "default_account": None})
         
-        # Mock update_config to capture the update function
-        updated_config = {}
-        def mock_update_config(update_func):
-            nonlocal updated_config
-            updated_config = update_func({"accounts": {}, "default_account": None})
-            return updated_config
-        monkeypatch.setattr("taskra.config.account.config_manager.update_config", mock_update_config)
+        # Record what the update function makes of the config
+        config_update_recorder.patch({"accounts": {}, "default_account": None})
         
         # Mock validate_credentials to return True
-        monkeypatch.setattr("taskra.config.account.validate_credentials", lambda *args, **kwargs: True)
+        monkeypatch.setattr(_account, "validate_credentials", lambda *args, **kwargs: True)
         
         success, _ = add_account("https://test.atlassian.net", "test@example.com", "api-token")
         
+        updated_config = config_update_recorder.result
         assert success
         assert "test" in updated_config["accounts"]
         assert updated_config["default_account"] == "test"
         assert updated_config["accounts"]["test"]["url"] == "https://test.atlassian.net"
         assert updated_config["accounts"]["test"]["email"] == "test@example.com"
 
-    def test_add_account_custom_name(self, monkeypatch):
+    def test_add_account_custom_name(self, monkeypatch, config_update_recorder):
         """Test adding an account with a custom name."""
         # Mock config
-        monkeypatch.setattr("taskra.config.account.config_manager.read_config", 
+        monkeypatch.setattr(_account.config_manager, "read_config", 
                         lambda: {"accounts": {}, "default_account": None})
         
-        # Mock update_config
-        updated_config = {}
-        def mock_update_config(update_func):
-            nonlocal updated_config
-            updated_config = update_func({"accounts": {}, "default_account": None})
-            return updated_config
-        monkeypatch.setattr("taskra.config.account.config_manager.update_config", mock_update_config)
+        # Record what the update function makes of the config
+        config_update_recorder.patch({"accounts": {}, "default_account": None})
         
         # Mock validate_credentials to return True
-        monkeypatch.setattr("taskra.config.account.validate_credentials", lambda *args, **kwargs: True)
+        monkeypatch.setattr(_account, "validate_credentials", lambda *args, **kwargs: True)
         
         success, _ = add_account("https://test.atlassian.net", "test@example.com", "api-token", name="custom")
         
+        updated_config = config_update_recorder.result
         assert success
         assert "custom" in updated_config["accounts"]
         assert updated_config["default_account"] == "custom"
@@ -158,7 +151,7 @@ class TestAccountManagement:
     def test_add_account_validation_failure(self, monkeypatch):
         """Test adding an account with invalid credentials."""
         # Mock validate_credentials to return False
-        monkeypatch.setattr("taskra.config.account.validate_credentials", lambda *args, **kwargs: False)
+        monkeypatch.setattr(_account, "validate_credentials", lambda *args, **kwargs: False)
         
         # Try to add an account with invalid credentials
         success, message = add_account("https://test.atlassian.net", "test@example.com", "bad-token")
@@ -166,7 +159,7 @@ class TestAccountManagement:
         assert not success
         assert "Invalid credentials" in message
 
-    def test_remove_account_standard(self, monkeypatch):
+    def test_remove_account_standard(self, monkeypatch, config_update_recorder):
         """Test removing a non-default account."""
         # Mock config with multiple accounts
         mock_config = {
@@ -178,29 +171,21 @@ class TestAccountManagement:
         }
         
         # Mock the read_config to return our test config
-        monkeypatch.setattr("taskra.config.account.config_manager.read_config", lambda: mock_config)
-        
-        # Mock the update_config to track the function was called correctly
-        updated_config = {}
+        monkeypatch.setattr(_account.config_manager, "read_config", lambda: mock_config)
         
-        def mock_update_config(update_func):
-            nonlocal updated_config
-            # Apply the update function to our mock config
-            result = update_func(mock_config.copy())
-            updated_config = result
-            return result
-            
-        monkeypatch.setattr("taskra.config.account.config_manager.update_config", mock_update_config)
+        # Record what the update function makes of the config
+        config_update_recorder.patch(mock_config)
         
         # Call remove_account
         success, _ = remove_account("account2")
         
+        updated_config = config_update_recorder.result
         assert success
         assert "account2" not in updated_config["accounts"]
         assert "account1" in updated_config["accounts"]
         assert updated_config["default_account"] == "account1"  # Default should remain unchanged
 
-    def test_remove_default_account(self, monkeypatch):
+    def test_remove_default_account(self, monkeypatch, config_update_recorder):
         """Test removing the default account."""
         # Mock config with multiple accounts
         mock_config = {
@@ -212,29 +197,21 @@ class TestAccountManagement:
         }
         
         # Mock the read_config to return our test config
-        monkeypatch.setattr("taskra.config.account.config_manager.read_config", lambda: mock_config)
+        monkeypatch.setattr(_account.config_manager, "read_config", lambda: mock_config)
         
-        # Mock the update_config to track the function was called correctly
-        updated_config = {}
-        
-        def mock_update_config(update_func):
-            nonlocal updated_config
-            # Apply the update function to our mock config
-            result = update_func(mock_config.copy())
-            updated_config = result
-            return result
-            
-        monkeypatch.setattr("taskra.config.account.config_manager.update_config", mock_update_config)
+        # Record what the update function makes of the config
+        config_update_recorder.patch(mock_config)
         
         # Call remove_account
         success, _ = remove_account("account1")
         
+        updated_config = config_update_recorder.result
         assert success
         assert "account1" not in updated_config["accounts"]
         assert "account2" in updated_config["accounts"]
         assert updated_config["default_account"] == "account2"  # Default should change
 
-    def test_remove_last_account(self, monkeypatch):
+    def test_remove_last_account(self, monkeypatch, config_update_recorder):
         """Test removing the last remaining account."""
         # Mock config with single account
         mock_config = {
@@ -245,28 +222,20 @@ class TestAccountManagement:
         }
         
         # Mock the read_config to return our test config
-        monkeypatch.setattr("taskra.config.account.config_manager.read_config", lambda: mock_config)
-        
-        # Mock the update_config to track the function was called correctly
-        updated_config = {}
+        monkeypatch.setattr(_account.config_manager, "read_config", lambda: mock_config)
         
-        def mock_update_config(update_func):
-            nonlocal updated_config
-            # Apply the update function to our mock config
-            result = update_func(mock_config.copy())
-            updated_config = result
-            return result
-            
-        monkeypatch.setattr("taskra.config.account.config_manager.update_config", mock_update_config)
+        # Record what the update function makes of the config
+        config_update_recorder.patch(mock_config)
         
         # Call remove_account
         success, _ = remove_account("account1")
         
+        updated_config = config_update_recorder.result
         assert success
         assert len(updated_config["accounts"]) == 0
         assert updated_config["default_account"] is None
 
-    def test_set_default_account(self, monkeypatch):
+    def test_set_default_account(self, monkeypatch, config_update_recorder):
         """Test setting the default account."""
         # Mock config with multiple accounts
         mock_config = {
@@ -277,19 +246,14 @@ class TestAccountManagement:
             "default_account": "account1"
         }
         
-        monkeypatch.setattr("taskra.config.account.config_manager.read_config", lambda: mock_config)
-        
-        # Capture the updated configuration
-        updated_config = {}
-        def mock_update_config(update_func):
-            nonlocal updated_config
-            updated_config = update_func(mock_config)
-            return updated_config
+        monkeypatch.setattr(_account.config_manager, "read_config", lambda: mock_config)
         
-        monkeypatch.setattr("taskra.config.account.config_manager.update_config", mock_update_config)
+        # Record what the update function makes of the config
+        config_update_recorder.patch(mock_config)
         
         success, _ = set_default_account("account2")
         
+        updated_config = config_update_recorder.result
         assert success
         assert updated_config["default_account"] == "account2"
 
@@ -303,7 +267,7 @@ class TestAccountManagement:
             "default_account": "account1"
         }
         
-        monkeypatch.setattr("taskra.config.account.config_manager.read_config", lambda: mock_config)
+        monkeypatch.setattr(_account.config_manager, "read_config", lambda: mock_config)
         
         success, message = set_default_account("nonexistent")
         
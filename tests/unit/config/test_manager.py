@@ -70,6 +70,21 @@ class TestConfigManager:
             data = json.load(f)
         assert data == test_config
 
+    def test_write_config_failure_keeps_original(self, test_config_manager, monkeypatch):
+        """Test that a failed write leaves the old file and no temporary file behind."""
+        test_config_manager.write_config({"key": "initial_value"})
+        
+        def failing_replace(src, dst):
+            raise OSError("Disk full")
+        
+        monkeypatch.setattr(os, "replace", failing_replace)
+        with pytest.raises(OSError):
+            test_config_manager.write_config({"key": "new_value"})
+        monkeypatch.undo()
+        
+        assert not os.path.exists(f"{test_config_manager.config_path}.tmp")
+        assert test_config_manager.read_config()["key"] == "initial_value"
+
     def test_update_config(self, test_config_manager):
         """Test updating configuration with a function."""
         # Start with initial config
@@ -111,3 +126,74 @@ class TestConfigManager:
         # Verify file still contains original data
         config = test_config_manager.read_config()
         assert config["key"] == "initial_value"
+
+    def test_read_config_view_is_read_only(self, test_config_manager):
+        """Test that read_config_view hands out one shared, read-only view."""
+        test_config_manager.write_config({"accounts": {"test": {}}})
+        
+        config = test_config_manager.read_config_view()
+        with pytest.raises(TypeError):
+            config["accounts"]["other"] = {}
+        
+        assert test_config_manager.read_config_view() is config
+        assert config == {"accounts": {"test": {}}}
+
+    def test_read_config_returns_independent_copies(self, test_config_manager):
+        """Test that read_config hands out dictionaries callers can modify and write back."""
+        test_config_manager.write_config({"accounts": {"test": {}}})
+        
+        first = test_config_manager.read_config()
+        first["accounts"]["other"] = {}
+        assert test_config_manager.read_config() == {"accounts": {"test": {}}}
+        
+        test_config_manager.write_config(first)
+        assert test_config_manager.read_config_view() == {"accounts": {"test": {}, "other": {}}}
+
+    def test_read_config_sees_external_replace(self, test_config_manager):
+        """Test that a file swapped in by another process is picked up."""
+        test_config_manager.write_config({"key": "aaa"})
+        assert test_config_manager.read_config_view()["key"] == "aaa"
+        
+        # Same size, written the way write_config does it: temp file + rename
+        temp_path = f"{test_config_manager.config_path}.other"
+        with open(temp_path, "w") as f:
+            json.dump({"key": "bbb"}, f, indent=2)
+        os.replace(temp_path, test_config_manager.config_path)
+        
+        assert test_config_manager.read_config_view()["key"] == "bbb"
+
+    def test_batch_writes_once(self, test_config_manager, mocker):
+        """Test that updates inside batch() are visible to reads and written once."""
+        test_config_manager.write_config({"accounts": {}})
+        write_spy = mocker.spy(test_config_manager, "write_config")
+        
+        def add(name):
+            def updater(config):
+                config["accounts"][name] = {}
+                return config
+            return updater
+        
+        with test_config_manager.batch():
+            test_config_manager.update_config(add("first"))
+            test_config_manager.update_config(add("second"))
+            assert set(test_config_manager.read_config()["accounts"]) == {"first", "second"}
+            write_spy.assert_not_called()
+        
+        write_spy.assert_called_once()
+        with open(test_config_manager.config_path, "r") as f:
+            assert set(json.load(f)["accounts"]) == {"first", "second"}
+
+    def test_batch_discards_updates_on_error(self, test_config_manager):
+        """Test that nothing is written when the batch block raises."""
+        test_config_manager.write_config({"key": "initial_value"})
+        
+        def updater(config):
+            config["key"] = "modified_value"
+            return config
+        
+        with pytest.raises(ValueError):
+            with test_config_manager.batch():
+                test_config_manager.update_config(updater)
+                raise ValueError("Test exception")
+        
+        assert test_config_manager.read_config()["key"] == "initial_value"
@@ -1,40 +1,52 @@
+import copy
 import os
 import tempfile
-from unittest.mock import Mock, MagicMock
+from types import SimpleNamespace
 import pytest
 
 from taskra.config.manager import ConfigManager
-from taskra.api.client import JiraClient
-from taskra.api.services.users import UserService
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def temp_config_dir():
-    """Create a temporary directory for test configurations."""
+    """Create a temporary directory for test configurations, shared by a test module."""
     with tempfile.TemporaryDirectory() as temp_dir:
         yield temp_dir
 
 @pytest.fixture
 def test_config_manager(temp_config_dir):
     """Create a ConfigManager instance using a temporary directory."""
-    return ConfigManager(config_dir=temp_config_dir)
+    manager = ConfigManager(config_dir=temp_config_dir)
+    # The directory outlives the test, so drop what earlier tests left in it
+    for path in (manager.config_path, f"{manager.config_path}.tmp"):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+    return manager
 
 @pytest.fixture
-def mock_jira_client():
-    """Create a mock JiraClient for testing."""
-    return Mock(spec=JiraClient)
+def mock_env_vars(monkeypatch):
+    """Set up environment variables for testing."""
+    monkeypatch.setenv("JIRA_BASE_URL", "https://example.atlassian.net")
+    monkeypatch.setenv("JIRA_API_TOKEN", "dummy-token")
+    monkeypatch.setenv("JIRA_EMAIL", "test@example.com")
 
 @pytest.fixture
-def mock_user_service():
-    """Create a mock UserService for testing."""
-    mock_service = Mock(spec=UserService)
-    mock_service.validate_credentials.return_value = True
-    return mock_service
+def config_update_recorder(monkeypatch):
+    """Stand in for the account module's config_manager.update_config.
 
-@pytest.fixture
-def mock_env_vars(monkeypatch):
-    """Set up environment variables for testing."""
-    with monkeypatch.context() as m:
-        m.setenv("JIRA_BASE_URL", "https://example.atlassian.net")
-        m.setenv("JIRA_API_TOKEN", "dummy-token")
-        m.setenv("JIRA_EMAIL", "test@example.com")
-        yield
+    Call ``.patch(initial_config)`` to install it; update functions then run
+    against a copy of that config and their result is kept on ``.result``.
+    """
+    from taskra.config import account
+    recorder = SimpleNamespace(result=None)
+
+    def patch(initial_config):
+        def update_config(update_func):
+            recorder.result = update_func(copy.deepcopy(initial_config))
+            return recorder.result
+        monkeypatch.setattr(account.config_manager, "update_config", update_config)
+        return recorder
+
+    recorder.patch = patch
+    return recorder